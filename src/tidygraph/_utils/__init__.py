@@ -1,8 +1,10 @@
 from tidygraph._utils.centrality import (
     centrality_betweenness,
+    centrality_betweenness_batch,
     centrality_closeness,
     centrality_degree,
     centrality_edge_betweenness,
+    centrality_edge_betweenness_batch,
     centrality_eigenvector,
     centrality_harmonic,
     centrality_pagerank,
@@ -15,9 +17,11 @@ __all__ = [
     "RESERVED_JOIN_KEYWORD",
     "ReservedGraphKeywords",
     "centrality_betweenness",
+    "centrality_betweenness_batch",
     "centrality_closeness",
     "centrality_degree",
     "centrality_edge_betweenness",
+    "centrality_edge_betweenness_batch",
     "centrality_eigenvector",
     "centrality_harmonic",
     "centrality_pagerank",
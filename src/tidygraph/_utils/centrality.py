@@ -1,9 +1,83 @@
+import inspect
+import os
+import warnings
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import wraps
+from itertools import chain, repeat
+from multiprocessing import get_context
+from typing import Concatenate, get_origin
+
 import igraph as ig
+import numpy as np
+import pandas as pd
 
 from tidygraph.activate import ActiveType
 from tidygraph.exceptions import TidygraphValueError
 
+_DEGREE_KWARGS = frozenset(("weights", "mode", "loops"))
+_HARMONIC_KWARGS = frozenset(("vertices", "weights", "mode", "cutoff", "normalized"))
+_BETWEENNESS_KWARGS = frozenset(("vertices", "directed", "cutoff", "weights", "sources", "targets", "chunk_size"))
+_EDGE_BETWEENNESS_KWARGS = frozenset(("directed", "cutoff", "weights", "sources", "targets", "chunk_size"))
+_CLOSENESS_KWARGS = frozenset(("vertices", "mode", "cutoff", "weights", "normalized"))
+_EIGENVECTOR_KWARGS = frozenset(("directed", "scale", "weights", "return_eigenvalue", "argpack_options"))
+_PAGERANK_KWARGS = frozenset(
+    (
+        "vertices",
+        "directed",
+        "damping",
+        "weights",
+        "argpack_options",
+        "implementation",
+        "start",
+        "reset",
+        "reset_vertices",
+    )
+)
+
+_PAGERANK_TOLERANCE = 1e-12
+"""L1 distance between successive iterates at which the warm-started PageRank is considered converged."""
+_PAGERANK_MAX_ITERATIONS = 1000
+"""Number of power iterations after which the warm-started PageRank gives up and warns that it did not converge."""
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(__file__))
+"""Directory of the tidygraph package, skipped when attributing warnings to the caller's code."""
+
+
+def _validated[**P, R](
+    expected: ActiveType,
+    accepted: frozenset[str],
+) -> Callable[[Callable[Concatenate[ActiveType, P], R]], Callable[Concatenate[ActiveType, P], R]]:
+    """Internal decorator validating the active context and the keyword arguments of a centrality function.
+
+    Calls from another context than `expected`, or with keyword arguments which are neither in `accepted` nor
+    named parameters of the decorated function, are rejected. Error messages are formatted once per decorated
+    function rather than per call.
+    """
+
+    def decorator(func: Callable[Concatenate[ActiveType, P], R]) -> Callable[Concatenate[ActiveType, P], R]:
+        context_message = f"`{func.__name__}` can only be applied on {expected.name.capitalize()} context."
+        kwargs_message = f"`{func.__name__}` received unexpected keyword arguments: "
+        named = frozenset(
+            name
+            for name, param in inspect.signature(func).parameters.items()
+            if param.kind is not inspect.Parameter.VAR_KEYWORD
+        )
+
+        @wraps(func)
+        def wrapper(active: ActiveType, *args: P.args, **kwargs: P.kwargs) -> R:
+            if active is not expected:
+                raise TidygraphValueError(context_message)
+            if unexpected := kwargs.keys() - accepted - named:
+                raise TidygraphValueError(f"{kwargs_message}{unexpected}")
+
+            return func(active, *args, **kwargs)
+
+        return wrapper
 
+    return decorator
+
+
+@_validated(ActiveType.NODES, _DEGREE_KWARGS)
 def centrality_degree(
     active: ActiveType,
     g: ig.Graph,
@@ -17,8 +91,12 @@ def centrality_degree(
         mode (str, Optional): `in`, `out`, or `all` representing the type of degree to be returned. \
             Defaults to `all`.
         loops (bool, Optional): Whether to count self-loops. Defaults to True.
-        weights (str | Iterable, Optional): Edge weights to be used. Can be a sequence or iterable or even an edge \
-            attribute name. `None` means to treat the graph as unweighted, falling back to ordinary degree calculations.
+        weights (str | Iterable | Callable, Optional): Edge weights to be used. Can be a sequence or iterable (a \
+            precomputed numpy array or pandas Series is passed through without building the edge dataframe), an \
+            edge attribute name, or a callable which receives the edge dataframe and returns the weights. If the \
+            callable's parameter is annotated as a `Mapping`, it instead receives a lazy mapping of edge attribute \
+            names to numpy arrays, skipping the dataframe construction. `None` means to treat the graph as \
+            unweighted, falling back to ordinary degree calculations.
 
     Returns:
         float or list of float representing calculated centrality.
@@ -29,21 +107,14 @@ def centrality_degree(
         [3] https://python.igraph.org/en/1.0.0/api/igraph.GraphBase.html#strength
         [4] https://python.igraph.org/en/1.0.0/api/igraph.GraphBase.html#degree
     """
-    if active != ActiveType.NODES:
-        raise TidygraphValueError("`centrality_degree` can only be applied on Nodes context.")
-
-    valid_keys = set(["weights", "mode", "loops"])
-    keys = set(kwargs.keys())
-    if not keys.issubset(valid_keys):
-        diff = keys - valid_keys
-        raise TidygraphValueError(f"`centrality_degree` received unexpected keyword arguments: {diff}")
+    weights = _extract_weights(g, kwargs)
+    if weights is None:
+        return g.degree(**kwargs)
 
-    if "weights" in kwargs:
-        return g.strength(**kwargs)
-
-    return g.degree(**kwargs)
+    return g.strength(weights=weights, **kwargs)
 
 
+@_validated(ActiveType.NODES, _HARMONIC_KWARGS)
 def centrality_harmonic(
     active: ActiveType,
     g: ig.Graph,
@@ -60,8 +131,12 @@ def centrality_harmonic(
             of outgoing paths, and `all` means both should be calculated. Defaults to `all`.
         cutoff (float, Optional): When not `None`, only paths less than or equal to this length are considered. \
             Defaults to None.
-        weights (str | Iterable, Optional): Edge weights to be used. Can be a sequence or iterable or even an edge \
-            attribute name. `None` means to treat the graph as unweighted, falling back to ordinary degree calculations.
+        weights (str | Iterable | Callable, Optional): Edge weights to be used. Can be a sequence or iterable (a \
+            precomputed numpy array or pandas Series is passed through without building the edge dataframe), an \
+            edge attribute name, or a callable which receives the edge dataframe and returns the weights. If the \
+            callable's parameter is annotated as a `Mapping`, it instead receives a lazy mapping of edge attribute \
+            names to numpy arrays, skipping the dataframe construction. `None` means to treat the graph as \
+            unweighted, falling back to ordinary degree calculations.
         normalized (bool, Optional): Whether to normalize the result. If True, the result is the mean inverse path \
             length to other vertices. If False, the result is the sum of inverse path lengths to other vertices. \
             Defaults to True.
@@ -72,18 +147,12 @@ def centrality_harmonic(
     References:
         [1] https://python.igraph.org/en/1.0.0/api/igraph.GraphBase.html#harmonic_centrality
     """
-    if active != ActiveType.NODES:
-        raise TidygraphValueError("`centrality_harmonic` can only be applied on Nodes context.")
-
-    valid_keys = set(["vertices", "weights", "mode", "cutoff", "normalized"])
-    keys = set(kwargs.keys())
-    if not keys.issubset(valid_keys):
-        diff = keys = valid_keys
-        raise TidygraphValueError(f"`centrality_harmonic` received unexpected keyword arguments: {diff}")
+    weights = _extract_weights(g, kwargs)
 
-    return g.harmonic_centrality(**kwargs)
+    return g.harmonic_centrality(weights=weights, **kwargs)
 
 
+@_validated(ActiveType.NODES, _BETWEENNESS_KWARGS)
 def centrality_betweenness(
     active: ActiveType,
     g: ig.Graph,
@@ -100,10 +169,17 @@ def centrality_betweenness(
         cutoff (int, Optional): If given, only paths less than or equal to this length are considered, \
             effectively resulting in an estimation of the betweenness for the given vertices. If `None`, the \
             exact betweenness is returned.
-        weights (str | Iterable, Optional): Edge weights to be used. Can be a sequence or iterable or even an edge \
-            attribute name. `None` means to treat the graph as unweighted, falling back to ordinary degree calculations.
+        weights (str | Iterable | Callable, Optional): Edge weights to be used. Can be a sequence or iterable (a \
+            precomputed numpy array or pandas Series is passed through without building the edge dataframe), an \
+            edge attribute name, or a callable which receives the edge dataframe and returns the weights. If the \
+            callable's parameter is annotated as a `Mapping`, it instead receives a lazy mapping of edge attribute \
+            names to numpy arrays, skipping the dataframe construction. `None` means to treat the graph as \
+            unweighted, falling back to ordinary degree calculations.
         sources (list[int], Optional): The set of source vertices to consider when calculating shortest paths.
         targets (list[int], Optional): The set of target vertices to consider when calculating shortest paths.
+        chunk_size (int, Optional): If given, source vertices are processed in chunks of this size and their \
+            contributions summed. The result is exact, but peak memory is bounded by the chunk size. Cannot be \
+            combined with `cutoff`.
 
     Returns:
         The (possibly cutoff-limited) betweenness of the given vertices in a list.
@@ -112,18 +188,16 @@ def centrality_betweenness(
         [1] https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.centrality.betweenness_centrality.html#networkx.algorithms.centrality.betweenness_centrality
         [2] https://python.igraph.org/en/1.0.0/api/igraph.GraphBase.html#betweenness
     """
-    if active != ActiveType.NODES:
-        raise TidygraphValueError("`centrality_betweenness` can only be applied on Nodes context.")
+    chunk_size = kwargs.pop("chunk_size", None)
+    weights = _extract_weights(g, kwargs)
 
-    valid_keys = set(["vertices", "directed", "cutoff", "weights", "sources", "targets"])
-    keys = set(kwargs.keys())
-    if not keys.issubset(valid_keys):
-        diff = keys = valid_keys
-        raise TidygraphValueError(f"`centrality_betweenness` received unexpected keyword arguments: {diff}")
+    if chunk_size is not None:
+        return _chunked_betweenness(g.betweenness, g, chunk_size, weights=weights, **kwargs)
 
-    return g.betweenness(**kwargs)
+    return g.betweenness(weights=weights, **kwargs)
 
 
+@_validated(ActiveType.EDGES, _EDGE_BETWEENNESS_KWARGS)
 def centrality_edge_betweenness(
     active: ActiveType,
     g: ig.Graph,
@@ -139,10 +213,17 @@ def centrality_edge_betweenness(
         cutoff (int, Optional): If given, only paths less than or equal to this length are considered, \
             effectively resulting in an estimation of the betweenness for the given values. If `None`, the \
             exact betweenness is returned.
-        weights (str | Iterable, Optional): Edge weights to be used. Can be a sequence or iterable or even an edge \
-            attribute name. `None` means to treat the graph as unweighted, falling back to ordinary degree calculations.
+        weights (str | Iterable | Callable, Optional): Edge weights to be used. Can be a sequence or iterable (a \
+            precomputed numpy array or pandas Series is passed through without building the edge dataframe), an \
+            edge attribute name, or a callable which receives the edge dataframe and returns the weights. If the \
+            callable's parameter is annotated as a `Mapping`, it instead receives a lazy mapping of edge attribute \
+            names to numpy arrays, skipping the dataframe construction. `None` means to treat the graph as \
+            unweighted, falling back to ordinary degree calculations.
         sources (list[int], Optional): The set of source vertices to consider when calculating shortest paths.
         targets (list[int], Optional): The set of target vertices to consider when calculating shortest paths.
+        chunk_size (int, Optional): If given, source vertices are processed in chunks of this size and their \
+            contributions summed. The result is exact, but peak memory is bounded by the chunk size. Cannot be \
+            combined with `cutoff`.
 
     Returns:
         A list with the (exact or estimated) edge betweenness of all edges.
@@ -151,18 +232,16 @@ def centrality_edge_betweenness(
         [1] https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.centrality.edge_betweenness_centrality.html
         [2] https://python.igraph.org/en/1.0.0/api/igraph.GraphBase.html#edge-betweenness
     """
-    if active != ActiveType.EDGES:
-        raise TidygraphValueError("`centrality_edge_betweenness` can only be applied on Edges context.")
+    chunk_size = kwargs.pop("chunk_size", None)
+    weights = _extract_weights(g, kwargs)
 
-    valid_keys = set(["directed", "cutoff", "weights", "sources", "targets"])
-    keys = set(kwargs.keys())
-    if not keys.issubset(valid_keys):
-        diff = keys = valid_keys
-        raise TidygraphValueError(f"`centrality_edge_betweenness` received unexpected arguments: {diff}")
+    if chunk_size is not None:
+        return _chunked_betweenness(g.edge_betweenness, g, chunk_size, weights=weights, **kwargs)
 
-    return g.edge_betweenness(**kwargs)
+    return g.edge_betweenness(weights=weights, **kwargs)
 
 
+@_validated(ActiveType.NODES, _CLOSENESS_KWARGS)
 def centrality_closeness(
     active: ActiveType,
     g: ig.Graph,
@@ -181,8 +260,12 @@ def centrality_closeness(
         cutoff (int, Optional): If given, only paths less than or equal to this length are considered, \
             effectively resulting in an estimation of the betweenness for the given vertices. If `None`, the \
             exact betweenness is returned.
-        weights (str | Iterable, Optional): Edge weights to be used. Can be a sequence or iterable or even an edge \
-            attribute name. `None` means to treat the graph as unweighted, falling back to ordinary degree calculations.
+        weights (str | Iterable | Callable, Optional): Edge weights to be used. Can be a sequence or iterable (a \
+            precomputed numpy array or pandas Series is passed through without building the edge dataframe), an \
+            edge attribute name, or a callable which receives the edge dataframe and returns the weights. If the \
+            callable's parameter is annotated as a `Mapping`, it instead receives a lazy mapping of edge attribute \
+            names to numpy arrays, skipping the dataframe construction. `None` means to treat the graph as \
+            unweighted, falling back to ordinary degree calculations.
         normalized (bool, Optional): Whether to normalize the raw closeness scores by multiplying by the \
             number of vertices minus one. Defaults to True.
 
@@ -192,18 +275,12 @@ def centrality_closeness(
     References:
         [1] https://python.igraph.org/en/1.0.0/api/igraph.GraphBase.html#closeness
     """
-    if active != ActiveType.NODES:
-        raise TidygraphValueError("`centrality_closeness` can only be applied on Nodes context.")
-
-    valid_keys = set(["vertices", "mode", "cutoff", "weights", "normalized"])
-    keys = set(kwargs.keys())
-    if not keys.issubset(valid_keys):
-        diff = keys = valid_keys
-        raise TidygraphValueError(f"`centrality_closeness` received unexpected arguments: {diff}")
+    weights = _extract_weights(g, kwargs)
 
-    return g.closeness(**kwargs)
+    return g.closeness(weights=weights, **kwargs)
 
 
+@_validated(ActiveType.NODES, _EIGENVECTOR_KWARGS)
 def centrality_eigenvector(
     active: ActiveType,
     g: ig.Graph,
@@ -227,8 +304,12 @@ def centrality_eigenvector(
         directed (bool, Optional): Whether to consider directed paths. Defaults to True.
         scale (bool, Optional): Whether to normalize the results wherein the largest value is scaled to 1 (and others \
             relative to that). Defaults to True.
-        weights (str | Iterable, Optional): Edge weights to be used. Can be a sequence or iterable or even an edge \
-            attribute name. `None` means to treat the graph as unweighted, falling back to ordinary degree calculations.
+        weights (str | Iterable | Callable, Optional): Edge weights to be used. Can be a sequence or iterable (a \
+            precomputed numpy array or pandas Series is passed through without building the edge dataframe), an \
+            edge attribute name, or a callable which receives the edge dataframe and returns the weights. If the \
+            callable's parameter is annotated as a `Mapping`, it instead receives a lazy mapping of edge attribute \
+            names to numpy arrays, skipping the dataframe construction. `None` means to treat the graph as \
+            unweighted, falling back to ordinary degree calculations.
         return_eigenvalue (bool, Optional): Whether to return the largest eigenvalue along with centralities. Defaults \
             to False.
         argpack_options (ARGPACKOptions, Optional): Object used to fine-tune the calculation. If omitted, a default \
@@ -237,18 +318,12 @@ def centrality_eigenvector(
     References:
         [1] https://python.igraph.org/en/1.0.0/api/igraph.GraphBase.html#eigenvector_centrality
     """
-    if active != ActiveType.NODES:
-        raise TidygraphValueError("`centrality_eigenvector` can only be applied on Nodes context.")
+    weights = _extract_weights(g, kwargs)
 
-    valid_keys = set(["directed", "scale", "weights", "return_eigenvalue", "argpack_options"])
-    keys = set(kwargs.keys())
-    if not keys.issubset(valid_keys):
-        diff = keys = valid_keys
-        raise TidygraphValueError(f"`centrality_eigenvector` received unexpected arguments: {diff}")
-
-    return g.eigenvector_centrality(**kwargs)
+    return g.eigenvector_centrality(weights=weights, **kwargs)
 
 
+@_validated(ActiveType.NODES, _PAGERANK_KWARGS)
 def centrality_pagerank(
     active: ActiveType,
     g: ig.Graph,
@@ -266,12 +341,24 @@ def centrality_pagerank(
         directed (bool, Optional): Whether to consider directed paths. Defaults to True.
         damping (float, Optional): The damping factor. Damping is the probability of resetting the random walk
             to a uniform distribution in each step. Defaults to `0.85`.
-        weights (str | Iterable, Optional): Edge weights to be used. Can be a sequence or iterable or even an edge \
-            attribute name. `None` means to treat the graph as unweighted, falling back to ordinary degree calculations.
+        weights (str | Iterable | Callable, Optional): Edge weights to be used. Can be a sequence or iterable (a \
+            precomputed numpy array or pandas Series is passed through without building the edge dataframe), an \
+            edge attribute name, or a callable which receives the edge dataframe and returns the weights. If the \
+            callable's parameter is annotated as a `Mapping`, it instead receives a lazy mapping of edge attribute \
+            names to numpy arrays, skipping the dataframe construction. `None` means to treat the graph as \
+            unweighted, falling back to ordinary degree calculations.
         argpack_options (ARGPACKOptions, Optional): Object used to fine-tune the calculation. If omitted, a default \
             variant is used.
         implementation (str, Optional): `prpack` or `arpack`. Determines which implementation used to solve the \
             PageRank eigenproblem. Defaults to `prpack`.
+        start (Iterable[float], Optional): A previous PageRank vector (one value per vertex) used to warm-start a \
+            power iteration instead of solving from scratch. Useful when recomputing PageRank on a slightly \
+            modified graph. Cannot be combined with `implementation`, `argpack_options` or personalization. \
+            Emits a `RuntimeWarning` if the iteration does not converge.
+        reset (str | Iterable[float], Optional): Personalizes the PageRank by resetting the random walk to this \
+            distribution (one value per vertex, or a vertex attribute name) instead of the uniform one.
+        reset_vertices (int | str | Iterable, Optional): Personalizes the PageRank by resetting the random walk \
+            uniformly to these vertices. Cannot be combined with `reset`.
 
     Returns:
         A list with personalized or non-personalized PageRank values of specified vertices.
@@ -279,22 +366,265 @@ def centrality_pagerank(
     References:
         [1] https://python.igraph.org/en/1.0.0/api/igraph.Graph.html#pagerank
     """
-    if active != ActiveType.NODES:
-        raise TidygraphValueError("`centrality_pagerank` can only be applied on Nodes context.")
-
-    valid_keys = set(
-        [
-            "vertices",
-            "directed",
-            "damping",
-            "weights",
-            "argpack_options",
-            "implementation",
-        ]
-    )
-    keys = set(kwargs.keys())
-    if not keys.issubset(valid_keys):
-        diff = keys = valid_keys
-        raise TidygraphValueError(f"`centrality_pagerank` received unexpected arguments: {diff}")
+    weights = _extract_weights(g, kwargs)
+
+    start = kwargs.pop("start", None)
+    if start is not None:
+        if kwargs.keys() & {"implementation", "argpack_options", "reset", "reset_vertices"}:
+            raise TidygraphValueError(
+                "`start` cannot be combined with `implementation`, `argpack_options`, `reset` or `reset_vertices`"
+            )
+
+        return _pagerank_power(g, start, weights=weights, **kwargs)
+
+    if isinstance(weights, np.ndarray):
+        # `pagerank` looks up unhashable weights as attribute names; hand over a plain list instead
+        weights = weights.tolist()
+
+    if isinstance(reset := kwargs.get("reset"), pd.Series):
+        # igraph walks a Series element by element; a contiguous array is handed over through the buffer protocol
+        kwargs["reset"] = reset.to_numpy(dtype=np.float64, copy=False)
+
+    # `Graph.pagerank` is `personalized_pagerank` without a reset distribution, so one call covers every case
+    return g.personalized_pagerank(weights=weights, **kwargs)
+
+
+@_validated(ActiveType.NODES, _BETWEENNESS_KWARGS)
+def centrality_betweenness_batch(
+    active: ActiveType,
+    graphs: Sequence[ig.Graph],
+    max_workers: int | None = None,
+    **kwargs: object,
+) -> list[list[float]]:
+    """Computes the betweenness of vertices for many graphs in parallel.
+
+    Each graph is handed to `centrality_betweenness` in a separate worker process. Arguments are validated and
+    callable weights are resolved once per graph before dispatching, so invalid calls fail without spawning workers.
+
+    Args:
+        graphs (Sequence[ig.Graph]): The graphs to calculate betweenness for.
+        max_workers (int, Optional): The maximum number of worker processes. Defaults to the number of CPUs.
+        kwargs: Keyword arguments accepted by `centrality_betweenness`, applied to every graph.
+
+    Returns:
+        The betweenness of each graph, in the same order as `graphs`.
+    """
+    return _centrality_batch(centrality_betweenness, active, graphs, max_workers, kwargs)
+
+
+@_validated(ActiveType.EDGES, _EDGE_BETWEENNESS_KWARGS)
+def centrality_edge_betweenness_batch(
+    active: ActiveType,
+    graphs: Sequence[ig.Graph],
+    max_workers: int | None = None,
+    **kwargs: object,
+) -> list[list[float]]:
+    """Computes the edge betweenness for many graphs in parallel.
+
+    Each graph is handed to `centrality_edge_betweenness` in a separate worker process. Arguments are validated and
+    callable weights are resolved once per graph before dispatching, so invalid calls fail without spawning workers.
+
+    Args:
+        graphs (Sequence[ig.Graph]): The graphs to calculate edge betweenness for.
+        max_workers (int, Optional): The maximum number of worker processes. Defaults to the number of CPUs.
+        kwargs: Keyword arguments accepted by `centrality_edge_betweenness`, applied to every graph.
+
+    Returns:
+        The edge betweenness of each graph, in the same order as `graphs`.
+    """
+    return _centrality_batch(centrality_edge_betweenness, active, graphs, max_workers, kwargs)
+
+
+def _centrality_batch(
+    func: Callable[..., list[float]],
+    active: ActiveType,
+    graphs: Sequence[ig.Graph],
+    max_workers: int | None,
+    kwargs: dict[str, object],
+) -> list[list[float]]:
+    """Internal helper to run a centrality function over many graphs in a process pool."""
+    if not graphs:
+        return []
+
+    # callables (e.g. lambdas) cannot be pickled, so weights are resolved here instead of in the workers
+    graph_kwargs = []
+    for g in graphs:
+        resolved = dict(kwargs)
+        resolved["weights"] = _extract_weights(g, resolved)
+        graph_kwargs.append(resolved)
+
+    # `spawn` avoids forking a process whose native libraries may already be running threads
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context("spawn")) as executor:
+        return list(executor.map(_apply_centrality, repeat(func), repeat(active), graphs, graph_kwargs))
+
+
+def _apply_centrality(
+    func: Callable[..., list[float]],
+    active: ActiveType,
+    g: ig.Graph,
+    kwargs: dict[str, object],
+) -> list[float]:
+    """Internal worker entrypoint for `_centrality_batch`."""
+    return func(active, g, **kwargs)
+
+
+def _chunked_betweenness(
+    betweenness: Callable[..., float | list[float]],
+    g: ig.Graph,
+    chunk_size: object,
+    **kwargs: object,
+) -> float | list[float]:
+    """Internal helper to accumulate (edge) betweenness over contiguous chunks of source vertices.
+
+    Betweenness is a sum of contributions from the shortest paths of each source vertex, so summing the subset
+    betweenness of each chunk is exact while only keeping `chunk_size` sources' path data alive at a time.
+    """
+    if not isinstance(chunk_size, int) or isinstance(chunk_size, bool) or chunk_size < 1:
+        raise TidygraphValueError(f"`chunk_size` must be a positive integer, got: {chunk_size!r}")
+
+    if kwargs.get("cutoff") is not None:
+        raise TidygraphValueError("`chunk_size` cannot be combined with `cutoff`")
+
+    sources = kwargs.pop("sources", None)
+    if sources is None:
+        sources = range(g.vcount())
+    elif isinstance(sources, int | str):
+        sources = [sources]
+    sources = list(sources)
+    if not sources:
+        return betweenness(sources=sources, **kwargs)
+
+    chunks = (sources[start : start + chunk_size] for start in range(0, len(sources), chunk_size))
+    total = np.asarray(betweenness(sources=next(chunks), **kwargs), dtype=np.float64)
+    for chunk in chunks:
+        total += betweenness(sources=chunk, **kwargs)
+
+    return total.tolist()
+
+
+def _pagerank_power(
+    g: ig.Graph,
+    start: object,
+    vertices: object = None,
+    directed: bool = True,
+    damping: float = 0.85,
+    weights: object = None,
+) -> float | list[float]:
+    """Internal helper computing PageRank by power iteration, seeded with a previous PageRank vector.
+
+    The transition matrix is never materialized; each iteration scatters the rank mass of the edge sources onto the
+    edge targets with `np.bincount`. Dangling vertices (no outgoing weight) spread their mass uniformly, matching
+    igraph's PRPACK implementation.
+    """
+    n = g.vcount()
+    x = np.asarray(start, dtype=np.float64)
+    if x.shape != (n,) or (x < 0).any():
+        raise TidygraphValueError(f"`start` must contain one non-negative value per vertex ({n})")
+    if n == 0:
+        return []
+
+    total = x.sum()
+    x = x / total if total > 0 else np.full(n, 1.0 / n)
+
+    # flattening the (source, target) tuples avoids numpy's nested-sequence inference, which dominates otherwise
+    edges = np.fromiter(chain.from_iterable(g.get_edgelist()), dtype=np.intp, count=2 * g.ecount()).reshape(-1, 2)
+    sources, targets = edges[:, 0], edges[:, 1]
+    if isinstance(weights, str):
+        weights = g.es[weights]
+    w = np.ones(len(edges)) if weights is None else np.asarray(weights, dtype=np.float64)
+    if not (directed and g.is_directed()):
+        sources, targets = np.concatenate((sources, targets)), np.concatenate((targets, sources))
+        w = np.concatenate((w, w))
+
+    # the out-strength is loop invariant, so fold it into per-edge transition probabilities once
+    out_strength = np.bincount(sources, weights=w, minlength=n)
+    dangling = out_strength == 0
+    # edges leaving a dangling vertex carry zero weight; their mass is spread uniformly instead of divided by zero
+    transition = np.divide(w, out_strength[sources], out=np.zeros_like(w), where=~dangling[sources])
+    for _ in range(_PAGERANK_MAX_ITERATIONS):
+        x_new = np.bincount(targets, weights=transition * x[sources], minlength=n)
+        x_new = damping * (x_new + x[dangling].sum() / n) + (1 - damping) / n
+        x_new /= x_new.sum()
+        converged = np.abs(x_new - x).sum() < _PAGERANK_TOLERANCE
+        x = x_new
+        if converged:
+            break
+    else:
+        warnings.warn(
+            f"warm-started PageRank did not converge within {_PAGERANK_MAX_ITERATIONS} iterations",
+            RuntimeWarning,
+            skip_file_prefixes=(_PACKAGE_DIR,),
+        )
+
+    if vertices is None:
+        return x.tolist()
+
+    if isinstance(vertices, int | str):
+        return float(x[g.vs.find(vertices).index])
+
+    return x[[g.vs.find(v).index for v in vertices]].tolist()
+
+
+def _extract_weights(g: ig.Graph, kwargs: dict[str, object]) -> object:
+    """Internal helper to pop and evaluate the `weights` argument.
+
+    The edge dataframe is only materialized when the weights are given as a callable which expects it, and at most
+    once per call. Pandas weights are handed to igraph as a float64 array, which it consumes considerably faster than
+    a Series.
+
+    Returns:
+        The weights in a form accepted by igraph, or None if the graph should be treated as unweighted.
+    """
+    weights = kwargs.pop("weights", None)
+    if callable(weights):
+        weights = weights(_EdgeColumns(g) if _accepts_mapping(weights) else g.get_edge_dataframe())
+
+    if isinstance(weights, pd.Series):
+        return weights.to_numpy(dtype=np.float64, copy=False)
+
+    return weights
+
+
+def _accepts_mapping(func: Callable[..., object]) -> bool:
+    """Internal helper to check whether the first parameter of `func` is annotated as a `Mapping`.
+
+    String annotations (e.g. under `from __future__ import annotations`) are evaluated in the namespace of `func`;
+    annotations which cannot be evaluated are left as strings and do not count as a `Mapping`.
+    """
+    try:
+        try:
+            signature = inspect.signature(func, eval_str=True)
+        except Exception:  # noqa: BLE001 - evaluating annotations runs arbitrary expressions
+            signature = inspect.signature(func)
+        parameter = next(iter(signature.parameters.values()))
+    except (StopIteration, TypeError, ValueError):
+        return False
+
+    annotation = get_origin(parameter.annotation) or parameter.annotation
+    return isinstance(annotation, type) and issubclass(annotation, Mapping)
+
+
+class _EdgeColumns(Mapping[str, np.ndarray]):
+    """Lazy, read-only view of edge attributes as numpy arrays.
+
+    Attributes are only copied out of igraph when first accessed, instead of materializing every attribute into a
+    dataframe up front.
+    """
+
+    def __init__(self, g: ig.Graph) -> None:
+        self._graph = g
+        self._columns: dict[str, np.ndarray] = {}
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        if key not in self._columns:
+            if key not in self._graph.es.attribute_names():
+                raise KeyError(key)
+            self._columns[key] = np.asarray(self._graph.es[key])
+
+        return self._columns[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._graph.es.attribute_names())
 
-    return g.pagerank(**kwargs)
+    def __len__(self) -> int:
+        return len(self._graph.es.attribute_names())
@@ -1,12 +1,13 @@
-from typing import NamedTuple, final
+from typing import ClassVar, final
 
 
 @final
-class ReservedGraphKeywords(NamedTuple):
+class ReservedGraphKeywords:
     """Reserved keywords based on internal graph manipulation needs."""
 
-    NODES = frozenset(["vertex ID"])
-    EDGES = frozenset(["node ID", "from", "to", "source", "target"])
+    NODES: ClassVar[frozenset[str]] = frozenset(["vertex ID"])
+    EDGES: ClassVar[frozenset[str]] = frozenset(["node ID", "from", "to", "source", "target"])
 
 
 RESERVED_JOIN_KEYWORD: str = "_index"
+"""Name of the temporary column holding vertex/edge IDs during joins."""
@@ -1,6 +1,8 @@
 from collections.abc import Iterable
+from itertools import chain
 
 import igraph as ig
+import numpy as np
 import pandas as pd
 from pandas.api.types import is_integer_dtype
 
@@ -28,92 +30,7 @@ def outer_join(
             Defaults to ".x".
         rsuffix (str, optional): Suffix to use for overlapping columns from the given (y) DataFrame. Defaults to ".y".
     """
-    x = g.get_edge_dataframe() if active == ActiveType.EDGES else g.get_vertex_dataframe()
-    x["_index"] = x.index.to_series()
-    y = y.copy()
-
-    if active == ActiveType.EDGES:
-        # augment y with node IDs
-        nodes_df = g.get_vertex_dataframe()
-        id_map = nodes_df.set_index("name")
-        name_to_index = pd.Series(data=nodes_df.index.to_numpy(), index=id_map.index)
-        are_indices = [is_integer_dtype(y["from"].dtype), is_integer_dtype(y["to"].dtype)]
-        if not all(are_indices):
-            y["source"] = y["from"].map(name_to_index)
-            y["target"] = y["to"].map(name_to_index)
-            y.drop(columns=["from", "to"], inplace=True)
-        else:
-            y = y.rename(columns={"from": "source", "to": "target"})
-        on = ["source", "target"]
-        if not g.is_directed():
-            y_mirror = y.rename(columns={"source": "target", "target": "source"})
-            y_with_mirror = pd.concat([y, y_mirror])
-            x_merged = x.merge(y_with_mirror, how="left", on=on, suffixes=(lsuffix, rsuffix), indicator=True)
-            explosion = x_merged[x_merged["_merge"] == "both"].groupby("_index").size()
-            explosion = explosion[explosion > 1]
-            for index in explosion.index:
-                name = x.loc[index][["source", "target"]]
-                new_filtered = x_merged[(x_merged["source"] == name["source"]) & (x_merged["target"] == name["target"])]
-                old_filtered = x[(x["source"] == name["source"]) & (x["target"] == name["target"])]
-                for i in range(1, len(new_filtered) - len(old_filtered) + 1):
-                    index = new_filtered.iloc[i * -1].name
-                    x_merged.at[index, "_merge"] = "right_only"
-            x_merged_mirror = x_merged.rename(columns={"source": "target", "target": "source"})
-            x_merged_with_mirror = pd.concat([x_merged, x_merged_mirror])
-            y_merged = y.merge(
-                x_merged_with_mirror.drop(columns=["_merge"]),
-                how="left",
-                on=on,
-                suffixes=(lsuffix, rsuffix),
-                indicator=True,
-            )
-            new_y = y_merged["_merge"] == "left_only"
-            new_rows = y_merged[new_y]
-            cols = [col for col in new_rows.columns if col.endswith(".x")]
-            for col in cols:
-                base = col[:-2]
-                new_rows[base] = new_rows[col].combine_first(new_rows[f"{base}.y"])
-                new_rows.drop(columns=[col, f"{base}.y"], inplace=True)
-            new_rows = new_rows[new_rows.columns.intersection(y.columns)]
-            new_rows["_merge"] = ["right_only"] * len(new_rows)
-            x_merged = pd.concat([x_merged, new_rows])
-        else:
-            x_merged = x.merge(y, how="outer", on=on, suffixes=(lsuffix, rsuffix), indicator=True)
-            explosion = x_merged[x_merged["_merge"] == "both"].groupby("_index").size()
-            explosion = explosion[explosion > 1]
-            for index in explosion.index:
-                name = x.loc[index][["source", "target"]]
-                new_filtered = x_merged[(x_merged["source"] == name["source"]) & (x_merged["target"] == name["target"])]
-                old_filtered = x[(x["source"] == name["source"]) & (x["target"] == name["target"])]
-                for i in range(1, len(new_filtered) - len(old_filtered) + 1):
-                    index = new_filtered.iloc[i * -1].name
-                    x_merged.at[index, "_merge"] = "right_only"
-    else:
-        x_merged = x.merge(y, how="outer", on=on, suffixes=(lsuffix, rsuffix), indicator=True)
-        explosion = x_merged[x_merged["_merge"] == "both"].groupby("_index").size()
-        explosion = explosion[explosion > 1]
-        for index in explosion.index:
-            name = x.loc[index]["name"]
-            new_filtered = x_merged[x_merged["name"] == name]
-            old_filtered = x[x["name"] == name]
-            for i in range(1, len(new_filtered) - len(old_filtered) + 1):
-                index = new_filtered.iloc[i * -1].name
-                x_merged.at[index, "_merge"] = "right_only"
-
-    x_merged.dropna(axis=1, how="all", inplace=True)
-    new = x_merged["_merge"] == "right_only"
-    new_rows = x_merged[new]
-    x_merged = x_merged[~new]
-    x_merged = x_merged.set_index("_index").sort_index()
-    x_merged = pd.concat([x_merged, new_rows])
-    x_merged.drop(columns=[col for col in x_merged if col.startswith("_")], inplace=True)
-    if active == ActiveType.NODES:
-        g.add_vertices(len(new_rows))
-    elif active == ActiveType.EDGES:
-        new_edges = new_rows[["source", "target"]].to_numpy()
-        g.add_edges(new_edges)
-
-    _apply_attributes(active, g, x_merged)
+    _join(active, g, y, "outer", on, lsuffix, rsuffix)
 
 
 def inner_join(
@@ -135,79 +52,7 @@ def inner_join(
             Defaults to ".x".
         rsuffix (str, optional): Suffix to use for overlapping columns from the given (y) DataFrame. Defaults to ".y".
     """
-    x = g.get_edge_dataframe() if active == ActiveType.EDGES else g.get_vertex_dataframe()
-    x["_index"] = x.index.to_series()
-    y = y.copy()
-
-    if active == ActiveType.EDGES:
-        nodes_df = g.get_vertex_dataframe()
-        id_map = nodes_df.set_index("name")
-        name_to_index = pd.Series(data=nodes_df.index.to_numpy(), index=id_map.index)
-        are_indices = [is_integer_dtype(y["from"].dtype), is_integer_dtype(y["to"].dtype)]
-        if not all(are_indices):
-            y["source"] = y["from"].map(name_to_index)
-            y["target"] = y["to"].map(name_to_index)
-            y.drop(columns=["from", "to"], inplace=True)
-        else:
-            y = y.rename(columns={"from": "source", "to": "target"})
-        on = ["source", "target"]
-        if not g.is_directed():
-            y_mirror = y.rename(
-                columns={
-                    "source": "target",
-                    "target": "source",
-                }
-            )
-            y = pd.concat([y, y_mirror])
-
-    x_merged = x.merge(y, how="inner", on=on, suffixes=(lsuffix, rsuffix), indicator=True)
-    explosion = x_merged[x_merged["_merge"] == "both"].groupby("_index").size()
-    explosion = explosion[explosion > 1]
-
-    if active == ActiveType.EDGES:
-        for index in explosion.index:
-            name = x.loc[index][["source", "target"]]
-            new_filtered = x_merged[(x_merged["source"] == name["source"]) & (x_merged["target"] == name["target"])]
-            old_filtered = x[(x["source"] == name["source"]) & (x["target"] == name["target"])]
-            for i in range(1, len(new_filtered) - len(old_filtered) + 1):
-                index = new_filtered.iloc[i * -1].name
-                x_merged.at[index, "_merge"] = "right_only"
-    else:
-        for index in explosion.index:
-            name = x.loc[index]["name"]
-            new_filtered = x_merged[x_merged["name"] == name]
-            old_filtered = x[x["name"] == name]
-            for i in range(1, len(new_filtered) - len(old_filtered) + 1):
-                index = new_filtered.iloc[i * -1].name
-                x_merged.at[index, "_merge"] = "right_only"
-
-    to_remove = x.merge(y, how="left_anti", on=on, suffixes=(lsuffix, rsuffix), indicator=True)
-    to_remove = to_remove[to_remove["_merge"] == "left_only"]
-    to_remove.set_index("_index", inplace=True)
-
-    x_merged.dropna(axis=1, how="all", inplace=True)
-    new = x_merged["_merge"] == "right_only" if not x_merged.empty else pd.Series([False] * len(x_merged))
-    new_rows = x_merged[new]
-    x_merged = x_merged[~new]
-    x_merged = pd.concat([x_merged, new_rows])
-    x_merged.drop(columns=[col for col in x_merged if col.startswith("_")], inplace=True)
-    if active == ActiveType.NODES:
-        if not to_remove.empty:
-            g.delete_vertices(to_remove.index.to_numpy())
-        if not new_rows.empty:
-            g.add_vertices(len(new_rows))
-    elif active == ActiveType.EDGES:
-        if not to_remove.empty:
-            source = to_remove["source"].to_numpy()
-            target = to_remove["target"].to_numpy()
-            # igraph strictly requires tuples
-            edges = tuple(zip(source, target, strict=True))
-            g.delete_edges(edges)
-        if not new_rows.empty:
-            new_edges = new_rows[["source", "target"]].to_numpy()
-            g.add_edges(new_edges)
-
-    _apply_attributes(active, g, x_merged)
+    _join(active, g, y, "inner", on, lsuffix, rsuffix)
 
 
 def left_join(
@@ -229,65 +74,7 @@ def left_join(
             Defaults to ".x".
         rsuffix (str, optional): Suffix to use for overlapping columns from the given (y) DataFrame. Defaults to ".y".
     """
-    x = g.get_edge_dataframe() if active == ActiveType.EDGES else g.get_vertex_dataframe()
-    x["_index"] = x.index.to_series()
-    y = y.copy()
-
-    if active == ActiveType.EDGES:
-        nodes_df = g.get_vertex_dataframe()
-        id_map = nodes_df.set_index("name")
-        name_to_index = pd.Series(data=nodes_df.index.to_numpy(), index=id_map.index)
-        are_indices = [is_integer_dtype(y["from"].dtype), is_integer_dtype(y["to"].dtype)]
-        if not all(are_indices):
-            y["source"] = y["from"].map(name_to_index)
-            y["target"] = y["to"].map(name_to_index)
-            y.drop(columns=["from", "to"], inplace=True)
-        else:
-            y = y.rename(columns={"from": "source", "to": "target"})
-        on = ["source", "target"]
-        if not g.is_directed():
-            y_mirror = y.rename(
-                columns={
-                    "source": "target",
-                    "target": "source",
-                }
-            )
-            y = pd.concat([y, y_mirror])
-
-    x_merged = x.merge(y, how="left", on=on, suffixes=(lsuffix, rsuffix), indicator=True)
-    explosion = x_merged[x_merged["_merge"] == "both"].groupby("_index").size()
-    explosion = explosion[explosion > 1]
-
-    if active == ActiveType.EDGES:
-        for index in explosion.index:
-            name = x.loc[index][["source", "target"]]
-            new_filtered = x_merged[(x_merged["source"] == name["source"]) & (x_merged["target"] == name["target"])]
-            old_filtered = x[(x["source"] == name["source"]) & (x["target"] == name["target"])]
-            for i in range(1, len(new_filtered) - len(old_filtered) + 1):
-                index = new_filtered.iloc[i * -1].name
-                x_merged.at[index, "_merge"] = "right_only"
-    else:
-        for index in explosion.index:
-            name = x.loc[index]["name"]
-            new_filtered = x_merged[x_merged["name"] == name]
-            old_filtered = x[x["name"] == name]
-            for i in range(1, len(new_filtered) - len(old_filtered) + 1):
-                index = new_filtered.iloc[i * -1].name
-                x_merged.at[index, "_merge"] = "right_only"
-
-    x_merged.dropna(axis=1, how="all", inplace=True)
-    new = x_merged["_merge"] == "right_only" if not x_merged.empty else pd.Series([False] * len(x_merged))
-    new_rows = x_merged[new]
-    x_merged = x_merged[~new]
-    x_merged = pd.concat([x_merged, new_rows])
-    x_merged.drop(columns=[col for col in x_merged if col.startswith("_")], inplace=True)
-    if active == ActiveType.NODES and not new_rows.empty:
-        g.add_vertices(len(new_rows))
-    elif active == ActiveType.EDGES and not new_rows.empty:
-        new_edges = new_rows[["source", "target"]].to_numpy()
-        g.add_edges(new_edges)
-
-    _apply_attributes(active, g, x_merged)
+    _join(active, g, y, "left", on, lsuffix, rsuffix)
 
 
 def right_join(
@@ -309,120 +96,350 @@ def right_join(
             Defaults to ".x".
         rsuffix (str, optional): Suffix to use for overlapping columns from the given (y) DataFrame. Defaults to ".y".
     """
-    x = g.get_edge_dataframe() if active == ActiveType.EDGES else g.get_vertex_dataframe()
-    x["_index"] = x.index.to_series()
-    y = y.copy()
+    _join(active, g, y, "right", on, lsuffix, rsuffix)
 
-    nodes_df = g.get_vertex_dataframe()
-    id_map = nodes_df.set_index("name")
-    name_to_index = pd.Series(data=nodes_df.index.to_numpy(), index=id_map.index)
+
+def _join(
+    active: ActiveType,
+    g: ig.Graph,
+    y: pd.DataFrame,
+    how: str,
+    on: str | Iterable[str] | None,
+    lsuffix: str,
+    rsuffix: str,
+) -> None:
+    """Internal helper performing a join of kind `how` between the graph's active component (x) and y in place.
+
+    Inner and right joins remove the vertices or edges without a match in y; rows only found in y, or matched more
+    than once, become new vertices or edges. Right joins are driven by y, so y is put in graph order first.
+    """
+    x, carried = _split_frame(active, g, y)
+    y = y.copy(deep=False)
 
     if active == ActiveType.EDGES:
-        are_indices = [is_integer_dtype(y["from"].dtype), is_integer_dtype(y["to"].dtype)]
-        if not all(are_indices):
-            y["source"] = y["from"].map(name_to_index)
-            y["target"] = y["to"].map(name_to_index)
-            y.drop(columns=["from", "to"], inplace=True)
-        else:
-            y = y.rename(columns={"from": "source", "to": "target"})
-        # sort y by existing indices; we need this since the main driver table is y (which can be unsorted)
-        y["_sort_index"] = [_get_edge_id(g, source, target) for source, target in y[["source", "target"]].to_numpy()]
-        y = y.sort_values("_sort_index").drop(columns=["_sort_index"])
-        if not y[["source", "target"]].notna().all().all():
-            raise TidygraphValueError("Cannot perform edge join on non-existing nodes in the graph")
+        y = _with_endpoints(g, y)
         on = ["source", "target"]
+        if how == "right":
+            if not y[["source", "target"]].notna().all().all():
+                raise TidygraphValueError("Cannot perform edge join on non-existing nodes in the graph")
+            # sort y by existing indices; we need this since the main driver table is y (which can be unsorted)
+            y["_sort_index"] = _edge_ids(g, y)
+            y = y.sort_values("_sort_index").drop(columns=["_sort_index"])
         if not g.is_directed():
-            x_mirror = x.rename(
-                columns={
-                    "source": "target",
-                    "target": "source",
-                }
-            )
-            x = pd.concat([x, x_mirror])
-    else:
-        y["_sort_index"] = y["name"].map(name_to_index)
+            # igraph lists undirected edges as (smaller, larger) endpoint pairs; ordering y the same way lets
+            # mirrored edges match in a single merge
+            y = _canonical(y)
+    elif how == "right":
+        y["_sort_index"] = y["name"].map(_name_to_index(g))
         y = y.sort_values("_sort_index").drop(columns=["_sort_index"])
 
-    x_merged = x.merge(y, how="right", on=on, suffixes=(lsuffix, rsuffix), indicator=True)
-    to_remove = x.merge(y, how="left_anti", on=on, suffixes=(lsuffix, rsuffix), indicator=True)
-    explosion = x_merged[x_merged["_merge"] == "both"].groupby("_index").size()
-    explosion = explosion[explosion > 1]
+    # reserved columns never become attributes, so they are not carried through the merge
+    reserved = ReservedGraphKeywords.NODES if active == ActiveType.NODES else ReservedGraphKeywords.EDGES - set(on)
+    y = y.drop(columns=[col for col in y.columns if col in reserved])
 
-    if active == ActiveType.EDGES:
-        for index in explosion.index:
-            name = y.loc[index][["source", "target"]]
-            new_filtered = x_merged[(x_merged["source"] == name["source"]) & (x_merged["target"] == name["target"])]
-            old_filtered = x[(x["source"] == name["source"]) & (x["target"] == name["target"])]
-            for i in range(1, len(new_filtered) - len(old_filtered) + 1):
-                index = new_filtered.iloc[i * -1].name
-                x_merged.at[index, "_merge"] = "right_only"
+    # without rows in y nothing can be right-only; a left merge then gives the same rows without sorting every key
+    x_merged = _merge(active, x, y, "left" if how == "outer" and not len(y) else how, on, lsuffix, rsuffix)
+    _flag_extra_matches(active, x_merged, x)
+    to_remove = _unmatched(active, x, y, on) if how in ("inner", "right") else np.empty(0, dtype=np.int64)
 
-        if not g.is_directed():
-            y_mirror = y.rename(columns={"source": "target", "target": "source"})
-            to_remove = to_remove.merge(y_mirror[["source", "target"]], on=on, how="left_anti")
-    else:
-        for index in explosion.index:
-            name = y.loc[index]["name"]
-            new_filtered = x_merged[x_merged["name"] == name]
-            old_filtered = x[x["name"] == name]
-            for i in range(1, len(new_filtered) - len(old_filtered) + 1):
-                index = new_filtered.iloc[i * -1].name
-                x_merged.at[index, "_merge"] = "right_only"
-
-    to_remove = to_remove[to_remove["_merge"] == "left_only"]
-    to_remove.set_index("_index", inplace=True)
-
-    x_merged.dropna(axis=1, how="all", inplace=True)
-    new = x_merged["_merge"] == "right_only" if not x_merged.empty else pd.Series([False] * len(x_merged))
-    new_rows = x_merged[new]
-    x_merged = x_merged[~new]
-    x_merged = pd.concat([x_merged, new_rows])
+    _drop_empty_overlaps(x_merged, x, y, lsuffix, rsuffix)
+    # kept rows are written back to the remaining vertices/edges in ID order; in a right join a key of y matching
+    # several of them interleaves their IDs with those of the next key
+    x_merged, num_new = _move_new_rows_last(x_merged, by_index=how in ("outer", "right"))
+    new_rows = x_merged.iloc[len(x_merged) - num_new :]
+    if active == ActiveType.EDGES:
+        endpoints = new_rows[["source", "target"]]
+        if endpoints.isna().any(axis=None):
+            raise TidygraphValueError("Cannot perform edge join on non-existing nodes in the graph")
+        # igraph rejects the float IDs endpoints turn into next to missing ones, and ingests plain lists of int pairs
+        # faster than arrays
+        new_edges = endpoints.to_numpy(dtype=np.int64).tolist()
+    unchanged = carried.columns if _same_rows(active, g, x_merged) else ()
+    x_merged = _attach_carried(active, g, x_merged, carried, lsuffix)
     x_merged.drop(columns=[col for col in x_merged if col.startswith("_")], inplace=True)
     if active == ActiveType.NODES:
-        if not to_remove.empty:
-            g.delete_vertices(to_remove.index.to_numpy())
-        g.add_vertices(len(new_rows))
+        if len(to_remove):
+            g.delete_vertices(to_remove)
+        if len(new_rows):
+            g.add_vertices(len(new_rows))
     elif active == ActiveType.EDGES:
-        if not to_remove.empty:
-            source = to_remove["source"].to_numpy()
-            target = to_remove["target"].to_numpy()
-            edges = tuple(zip(source, target, strict=True))
-            g.delete_edges(edges)
-
-        new_edges = new_rows[["source", "target"]].to_numpy()
-        g.add_edges(new_edges)
+        if len(to_remove):
+            # deleting by edge ID also pins down the exact edge among parallel edges
+            g.delete_edges(to_remove)
+        if new_edges:
+            g.add_edges(new_edges)
 
-    _apply_attributes(active, g, x_merged)
+    _apply_attributes(active, g, x_merged, unchanged)
 
 
 def _apply_attributes(
     active: ActiveType,
     g: ig.Graph,
     data: pd.DataFrame,
+    unchanged: Iterable[str] = (),
 ) -> None:
-    """Internal helper to apply updated attributes to the graph."""
-    target = g.vs if active == ActiveType.NODES else g.es
+    """Internal helper to apply updated attributes to the graph.
 
-    # remove old attributes; these are already handled in merge
-    old_attrs = set(target.attribute_names())
-    for attr in old_attrs:
+    Columns listed in `unchanged` hold the graph's current values of the attribute of the same name, followed by missing
+    values for vertices or edges added since; they are only written if the attribute had to be removed to keep the
+    attribute order.
+    """
+    target = g.vs if active == ActiveType.NODES else g.es
+    reserved = ReservedGraphKeywords.NODES if active == ActiveType.NODES else ReservedGraphKeywords.EDGES
+    columns = list(data.columns.drop(list(reserved), errors="ignore"))
+
+    # old attributes are already handled in merge; those matching the leading columns are overwritten in place below,
+    # the rest are removed so that the attribute order follows the merged columns
+    old_attrs = target.attribute_names()
+    kept = 0
+    while kept < min(len(old_attrs), len(columns)) and old_attrs[kept] == columns[kept]:
+        kept += 1
+    for attr in old_attrs[kept:]:
         del target[attr]
 
-    reserved = ReservedGraphKeywords.NODES if active == ActiveType.NODES else ReservedGraphKeywords.EDGES
-    for col in data.columns:
-        if col in reserved:
+    unchanged = set(unchanged)
+    for i, col in enumerate(columns):
+        if i < kept and col in unchanged:
             continue
+        values = data[col].to_numpy()
+        # igraph converts integer arrays element by element through numpy scalars; plain lists are ~3x faster to
+        # ingest, while float, bool and object arrays are faster handed over as is
+        target[col] = values.tolist() if values.dtype.kind in "iu" else values
+
+
+def _merge(
+    active: ActiveType,
+    x: pd.DataFrame,
+    y: pd.DataFrame,
+    how: str,
+    on: str | Iterable[str] | None,
+    lsuffix: str,
+    rsuffix: str,
+) -> pd.DataFrame:
+    """Internal helper to merge the graph's active component (x) with y, flagging rows only found in y in `_new`.
+
+    Edges are merged on a single int64 `_edge_key` packing both endpoints, which pandas hashes considerably faster
+    than the endpoint pair; the endpoints of rows only found in y are unpacked from it again. The key is left in the
+    result, with the other internal columns. Edges of y with missing endpoints fall back to a regular merge, as do
+    inner merges, for which pandas does not keep the order of y among multiple matches on a single key.
+    """
+    packable = active == ActiveType.EDGES and how != "inner"
+    if not (packable and is_integer_dtype(y["source"]) and is_integer_dtype(y["target"])):
+        merged = x.merge(y, how=how, on=on, suffixes=(lsuffix, rsuffix))
+    else:
+        x = x.assign(_edge_key=_edge_keys(x))
+        y = y.drop(columns=["source", "target"]).assign(_edge_key=_edge_keys(y))
+        merged = x.merge(y, how=how, on="_edge_key", suffixes=(lsuffix, rsuffix))
+        if how in ("outer", "right"):
+            keys = merged["_edge_key"].to_numpy()
+            merged["source"] = keys >> 32
+            merged["target"] = keys & 0xFFFFFFFF
+
+    # only rows from y lack the ID of a vertex or edge of x, so no categorical merge indicator is needed
+    merged["_new"] = merged["_index"].isna()
+    return merged
+
+
+def _unmatched(
+    active: ActiveType,
+    x: pd.DataFrame,
+    y: pd.DataFrame,
+    on: str | Iterable[str] | None,
+) -> np.ndarray:
+    """Internal helper returning the sorted, unique IDs (`_index`) of the rows of x without a match in y.
+
+    Edges are matched on their packed endpoint keys with a single hash probe; edges of y with missing endpoints
+    cannot match any edge of the graph and are skipped. Vertices are probed on the join keys, which default to the
+    columns shared with y as in a merge, without materializing a join.
+    """
+    index = x["_index"].to_numpy()
+    if active == ActiveType.EDGES:
+        matched = np.isin(_edge_keys(x), _edge_keys(y[["source", "target"]].dropna()))
+        return np.setdiff1d(index, index[matched])
+
+    keys = list(x.columns.intersection(y.columns)) if on is None else [on] if isinstance(on, str) else list(on)
+    if len(keys) == 1:
+        matched = x[keys[0]].isin(y[keys[0]]).to_numpy()
+    else:
+        matched = pd.MultiIndex.from_frame(x[keys]).isin(pd.MultiIndex.from_frame(y[keys]))
+    return np.unique(index[~matched])
+
+
+def _flag_extra_matches(active: ActiveType, merged: pd.DataFrame, x: pd.DataFrame) -> None:
+    """Internal helper flagging the rows a merge added for vertices or edges of x matched more than once.
 
-        target[col] = data[col].to_numpy()
+    For each ID (`_index`) found in more than one row, the key columns are read from the merged rows carrying it. Of
+    the merged rows carrying such a key, all but as many as x holds are flagged in `_new`, starting from the last one,
+    so that they become new vertices or edges.
+    """
+    columns = ["source", "target"] if active == ActiveType.EDGES else ["name"]
+    matched = merged["_index"].value_counts()
+    exploded = matched.index[matched.to_numpy() > 1].to_numpy(dtype=np.int64)
+    if not len(exploded):
+        return
+
+    flagged = merged.loc[merged["_index"].isin(exploded), columns].dropna().drop_duplicates()
+    rows = merged[columns].assign(_pos=np.arange(len(merged))).merge(flagged, on=columns).sort_values("_pos")
+    rows = rows.merge(x.groupby(columns).size().rename("_old").reset_index(), on=columns, how="left")
+    groups = rows.groupby(columns, sort=False)
+    surplus = groups["_pos"].transform("size") - rows["_old"].fillna(0)
+    extra = rows["_pos"].to_numpy()[groups.cumcount(ascending=False).to_numpy() < surplus.to_numpy()]
+    merged.loc[merged.index[extra], "_new"] = True
+
+
+def _with_endpoints(g: ig.Graph, y: pd.DataFrame) -> pd.DataFrame:
+    """Internal helper replacing the `from`/`to` columns of y by the vertex IDs `source`/`target`.
+
+    Integer columns are taken as vertex IDs already; otherwise both are looked up by vertex name, and names missing
+    from the graph give missing IDs.
+    """
+    if is_integer_dtype(y["from"].dtype) and is_integer_dtype(y["to"].dtype):
+        return y.rename(columns={"from": "source", "to": "target"})
+
+    name_to_index = _name_to_index(g)
+    y = y.assign(source=y["from"].map(name_to_index), target=y["to"].map(name_to_index))
+    return y.drop(columns=["from", "to"])
+
+
+def _canonical(edges: pd.DataFrame) -> pd.DataFrame:
+    """Internal helper ordering the endpoints of every edge as igraph lists undirected edges: (smaller, larger)."""
+    source, target = edges["source"].to_numpy(), edges["target"].to_numpy()
+    return edges.assign(source=np.minimum(source, target), target=np.maximum(source, target))
+
+
+def _edge_keys(edges: pd.DataFrame) -> np.ndarray:
+    """Internal helper packing the source and target of each edge into a single int64 key."""
+    source = edges["source"].to_numpy(dtype=np.int64)
+    target = edges["target"].to_numpy(dtype=np.int64)
+    return (source << 32) | (target & 0xFFFFFFFF)
+
+
+def _split_frame(active: ActiveType, g: ig.Graph, y: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Internal helper to build the graph's active component as two frames indexed by vertex or edge ID.
+
+    The first frame holds the columns taking part in a join with `y`: the vertex names or the edge endpoints, the
+    attributes shared with `y`, and the vertex or edge ID as `_index`, which survives the merges. The second frame
+    holds all other attributes, which are only carried along by the join and are attached again afterwards by
+    `_attach_carried`, so that they never pass through the merges.
+    """
+    target = g.vs if active == ActiveType.NODES else g.es
+    index = pd.RangeIndex(len(target))
+    joined, carried = [], []
+    for attr in target.attribute_names():
+        if attr in y.columns or (active == ActiveType.NODES and attr == "name"):
+            joined.append(attr)
+        else:
+            carried.append(attr)
+
+    x = pd.DataFrame({attr: target[attr] for attr in joined}, index=index)
+    if active == ActiveType.EDGES:
+        edges = np.fromiter(chain.from_iterable(g.get_edgelist()), dtype=np.int64, count=2 * g.ecount())
+        x.insert(0, "source", edges[0::2], allow_duplicates=True)
+        x.insert(1, "target", edges[1::2], allow_duplicates=True)
+    # IDs are positional, so they are written directly rather than copied out of the index
+    x["_index"] = np.arange(len(target), dtype=np.int64)
+
+    return x, pd.DataFrame({attr: target[attr] for attr in carried}, index=index)
+
+
+def _attach_carried(
+    active: ActiveType,
+    g: ig.Graph,
+    merged: pd.DataFrame,
+    carried: pd.DataFrame,
+    lsuffix: str,
+) -> pd.DataFrame:
+    """Internal helper to attach the attributes split off by `_split_frame` to the rows of a merged frame.
+
+    Each row takes the carried values of the vertex or edge in its `_index`; rows without one get missing values.
+    Columns are ordered as `get_vertex_dataframe`/`get_edge_dataframe` would have placed them before the merge.
+    """
+    values = carried.reindex(merged["_index"].to_numpy())
+    values.index = merged.index
+    merged = pd.concat([merged, values], axis=1)
+
+    target = g.vs if active == ActiveType.NODES else g.es
+    original = (
+        target.attribute_names() if active == ActiveType.NODES else ["source", "target", *target.attribute_names()]
+    )
+    order = []
+    for col in original:
+        if f"{col}{lsuffix}" in merged.columns:
+            order.append(f"{col}{lsuffix}")
+        elif col in carried.columns or col in merged.columns:
+            order.append(col)
+    order.extend(col for col in merged.columns if col not in order)
+
+    return merged[order]
+
+
+def _same_rows(active: ActiveType, g: ig.Graph, merged: pd.DataFrame) -> bool:
+    """Internal helper telling whether a merged frame keeps the graph's vertices or edges in order.
+
+    Rows beyond those may only be new ones without an ID, for which igraph fills any attribute not written with None.
+    """
+    index = merged["_index"].to_numpy(dtype=np.float64)
+    count = g.vcount() if active == ActiveType.NODES else g.ecount()
+    return (
+        len(index) >= count and np.array_equal(index[:count], np.arange(count)) and bool(np.isnan(index[count:]).all())
+    )
+
+
+def _drop_empty_overlaps(
+    merged: pd.DataFrame,
+    x: pd.DataFrame,
+    y: pd.DataFrame,
+    lsuffix: str,
+    rsuffix: str,
+) -> None:
+    """Internal helper to drop suffixed overlapping columns which the merge left entirely empty.
+
+    Only the columns suffixed by the merge are scanned for missing values, rather than every column of `merged`.
+    Overlapping non-key columns are recognized by no longer being present in `merged` under their own name.
+    """
+    overlap = x.columns.intersection(y.columns).difference(merged.columns)
+    suffixed = [f"{col}{suffix}" for col in overlap for suffix in (lsuffix, rsuffix)]
+    merged.drop(columns=[col for col in suffixed if col in merged and merged[col].isna().all()], inplace=True)
+
+
+def _move_new_rows_last(merged: pd.DataFrame, by_index: bool = False) -> tuple[pd.DataFrame, int]:
+    """Internal helper to stably reorder a merged frame so that rows new to the graph (`_new`) come last.
+
+    The frame is reordered with a single `take`, rather than split into existing and new rows and concatenated
+    back together. If `by_index` is set, existing rows are additionally sorted by their original `_index`.
+
+    Returns:
+        The reordered frame and the number of new rows at its end.
+    """
+    new = merged["_new"].to_numpy(dtype=bool)
+    if by_index:
+        # lexsort is stable and sorts by its last key first; new rows share a dummy index to keep their order
+        order = np.lexsort((np.where(new, 0, merged["_index"].to_numpy(dtype=np.float64)), new))
+    else:
+        order = np.argsort(new, kind="stable")
+
+    return merged.take(order), int(new.sum())
+
+
+def _name_to_index(g: ig.Graph) -> pd.Series:
+    """Internal helper mapping vertex names to vertex IDs.
+
+    Only the `name` attribute is read, instead of materializing every vertex attribute in a vertex dataframe.
+    """
+    return pd.Series(data=np.arange(g.vcount()), index=g.vs["name"])
 
 
-def _get_edge_id(g: ig.Graph, source: int, target: int) -> int | None:
-    """Internal wrapper around `igraph.get_eid`.
+def _edge_ids(g: ig.Graph, edges: pd.DataFrame) -> np.ndarray:
+    """Internal helper looking up the ID of each edge of a frame by its `source` and `target` vertex IDs.
 
-    This should be used when you do not want to crash the program when the edge
-    does not exist. Instead, return None.
+    Edges missing from the graph, including those with endpoints outside of it, get NaN instead of an ID. Among
+    parallel edges, igraph returns the highest ID.
     """
-    try:
-        return g.get_eid(source, target)
-    except Exception:
-        return None
+    source = edges["source"].to_numpy(dtype=np.int64)
+    target = edges["target"].to_numpy(dtype=np.int64)
+    valid = (source >= 0) & (source < g.vcount()) & (target >= 0) & (target < g.vcount())
+
+    found = np.asarray(g.get_eids(np.column_stack((source, target))[valid].tolist(), error=False), dtype=np.float64)
+    ids = np.full(len(edges), np.nan)
+    ids[valid] = np.where(found >= 0, found, np.nan)
+    return ids
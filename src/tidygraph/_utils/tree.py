@@ -3,7 +3,7 @@ import igraph as ig
 from tidygraph.exceptions import TidygraphValueError
 
 
-def is_tree(g: ig.Graph) -> bool:
+def is_tree(g: ig.Graph, components: ig.VertexClustering | None = None) -> bool:
     """Returns True if the graph `g` is a tree.
 
     A tree is a connected graph with no undirected cycles.
@@ -13,6 +13,7 @@ def is_tree(g: ig.Graph) -> bool:
 
     Args:
         g: The igraph graph to test
+        components: The weakly connected components of `g`, if already computed. Defaults to None.
 
     Returns:
         True if the graph is a tree, False otherwise.
@@ -26,14 +27,17 @@ def is_tree(g: ig.Graph) -> bool:
     if not g:
         raise TidygraphValueError("graph `g` has no nodes")
 
-    is_connected = g.is_connected()
-    if g.is_directed():
+    if components is not None:
+        is_connected = len(components) == 1
+    elif g.is_directed():
         is_connected = g.is_connected(mode="weak")
+    else:
+        is_connected = g.is_connected()
 
     return g.vcount() - 1 == g.ecount() and is_connected
 
 
-def is_forest(g: ig.Graph) -> bool:
+def is_forest(g: ig.Graph, components: ig.VertexClustering | None = None) -> bool:
     """Returns True if the graph `g` is a forest.
 
     A forest is a graph with no undirected cycles.
@@ -43,6 +47,7 @@ def is_forest(g: ig.Graph) -> bool:
 
     Args:
         g: The igraph graph to test
+        components: The weakly connected components of `g`, if already computed. Defaults to None.
 
     Returns:
         True if the graph is a forest, False otherwise.
@@ -56,10 +61,9 @@ def is_forest(g: ig.Graph) -> bool:
     if not g:
         raise TidygraphValueError("graph `g` has no nodes")
 
-    components = (g.subgraph(c) for c in g.connected_components())
-    if g.is_directed():
-        components = (g.subgraph(c) for c in g.connected_components(mode="weak"))
+    if components is None:
+        components = g.connected_components(mode="weak") if g.is_directed() else g.connected_components()
 
-    components = list(components)
-
-    return all([c.vcount() - 1 == c.ecount() for c in components])
+    # every component with n vertices has at least n - 1 edges, and exactly n - 1 only if it is a tree; summed over
+    # all components, the graph is a forest iff it has as many edges as vertices minus components
+    return g.vcount() - g.ecount() == len(components)
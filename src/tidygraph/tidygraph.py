@@ -8,9 +8,6 @@ from typing import TYPE_CHECKING, Any, Literal
 import igraph as ig
 import narwhals as nw
 import pandas as pd
-from igraph.drawing import BoundingBox
-from igraph.drawing.cairo.plot import CairoPlot
-from narwhals.typing import IntoDataFrame
 
 from tidygraph._utils import (
     RESERVED_JOIN_KEYWORD,
@@ -33,7 +30,10 @@ from tidygraph.activate import ActiveState, ActiveType
 from tidygraph.exceptions import TidygraphError, TidygraphValueError
 
 if TYPE_CHECKING:
+    from igraph.drawing import BoundingBox
+    from igraph.drawing.cairo.plot import CairoPlot
     from matplotlib.axes import Axes
+    from narwhals.typing import IntoDataFrame
     from plotly.graph_objects import Figure
 
 __all = ["Tidygraph"]
@@ -221,16 +221,14 @@ class Tidygraph:
         reserved = (
             ReservedGraphKeywords.NODES if self._activate.active == ActiveType.NODES else ReservedGraphKeywords.EDGES
         )
-        columns = list(modified_df.columns)
-        start_index = next((i for i, x in enumerate(columns) if x not in reserved), None)
-        if start_index is None:
+        attributes = modified_df.columns.drop(list(reserved), errors="ignore")
+        if attributes.empty:
             # Technically this should never happen but adding for completeness
             raise TidygraphValueError("no attributes to modify")
 
-        # TODO: Consider optimizing this by only updating the modified columns instead of all columns.
+        # only the assigned columns can differ from the graph's attributes; the others are left untouched
         target = self._graph.vs if self._activate.active == ActiveType.NODES else self._graph.es
-        attributes = list(modified_df.columns[start_index:])
-        for attribute in attributes:
+        for attribute in attributes.intersection(list(kwargs), sort=False):
             target[attribute] = modified_df[attribute]
 
         return self
@@ -305,12 +303,14 @@ class Tidygraph:
         if not self._graph:
             return "An empty graph"
 
+        # weak components are the components of undirected graphs; computed once for all the properties below
+        weak_components = self._graph.connected_components(mode="weak")
         properties: dict[str, Any] = {
             "simple": self._graph.is_simple(),
             "directed": self._graph.is_directed(),
             "bipartite": self._graph.is_bipartite(),
-            "tree": is_tree(self._graph),
-            "forest": is_forest(self._graph),
+            "tree": is_tree(self._graph, weak_components),
+            "forest": is_forest(self._graph, weak_components),
             "dag": self._graph.is_dag(),
         }
         description: list[str] = []
@@ -320,10 +320,7 @@ class Tidygraph:
             else:
                 description.append("unrooted")
 
-            components = len(self._graph.components())
-            if properties["directed"]:
-                components = len(self._graph.components(mode="weak"))
-
+            components = len(weak_components)
             if components > 1:
                 description.append(f"forest with {components} trees")
             else:
@@ -342,7 +339,7 @@ class Tidygraph:
             else:
                 description.append("multigraph")
 
-            components = len(self._graph.components())
+            components = len(self._graph.components() if properties["directed"] else weak_components)
             description.append(f"with {components} component(s)")
 
         return " ".join(description)
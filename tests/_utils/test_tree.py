@@ -51,6 +51,7 @@ def test_is_tree(nodes, edges, directed, expected):
 
     result = tree.is_tree(g)
     assert result == expected
+    assert tree.is_tree(g, g.connected_components(mode="weak")) == expected
 
 
 @pytest.mark.parametrize(
@@ -86,3 +87,4 @@ def test_is_forest(nodes, edges, directed, expected):
 
     result = tree.is_forest(g)
     assert result == expected
+    assert tree.is_forest(g, g.connected_components(mode="weak")) == expected
@@ -1,9 +1,21 @@
+import random
+import string
+from collections.abc import Mapping
 from typing import Any
 
 import igraph as ig
+import numpy as np
+import pandas as pd
 import pytest
+from pytest_mock import MockerFixture
 
 from tidygraph import Tidygraph
+from tidygraph._utils import (
+    centrality_betweenness,
+    centrality_betweenness_batch,
+    centrality_edge_betweenness,
+    centrality_edge_betweenness_batch,
+)
 from tidygraph.activate import ActiveType
 from tidygraph.exceptions import TidygraphValueError
 from tidygraph.tidygraph import CentralityKind
@@ -14,24 +26,21 @@ ALL = NODE_KINDS + EDGE_KINDS
 
 KIND_MAPPING = {kind: ActiveType.NODES if kind in NODE_KINDS else ActiveType.EDGES for kind in ALL}
 
+DIAMOND_EDGES = ((0, 1), (0, 2), (1, 3), (2, 3))
+DIAMOND_NAMES = tuple(string.ascii_lowercase[:4])
+
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="module")
 def graph() -> ig.Graph:
-    """Creates a sample diamond graph for tests."""
-    n = 4
-    edges = [
-        (0, 1),
-        (0, 2),
-        (1, 3),
-        (2, 3),
-    ]
-    max = 26  # assume we have max of 26 nodes
-    start = ord("a")
+    """Creates a sample diamond graph for tests.
+
+    Centrality never modifies the graph, so a single instance is shared by every test in this module.
+    """
     g = ig.Graph(
-        n=n,
-        edges=edges,
-        vertex_attrs={"name": [chr(start + (char % max)) for char in range(n)]},
-        edge_attrs={"weight": [0.2 for _ in range(n)]},
+        n=len(DIAMOND_NAMES),
+        edges=DIAMOND_EDGES,
+        vertex_attrs={"name": list(DIAMOND_NAMES)},
+        edge_attrs={"weight": [0.2] * len(DIAMOND_EDGES)},
     )
 
     return g
@@ -42,6 +51,15 @@ def kind_mapping():
     return KIND_MAPPING
 
 
+@pytest.fixture(scope="module")
+def tg_by_active(graph: ig.Graph) -> dict[ActiveType, Tidygraph]:
+    """Tidygraph objects over the shared graph, one per activation.
+
+    `activate` switches the object in place, so each activation gets its own instance.
+    """
+    return {active: Tidygraph(graph=graph).activate(active) for active in ActiveType}
+
+
 def test_centrality_raises_on_unknown_type(graph: ig.Graph):
     with pytest.raises(TidygraphValueError):
         tg = Tidygraph(graph=graph)
@@ -50,7 +68,8 @@ def test_centrality_raises_on_unknown_type(graph: ig.Graph):
 
 @pytest.mark.parametrize(
     "how,inputs",
-    [pytest.param(kind, {"what": "something"}, id=f"{kind} fails on unknown arg") for kind in ALL],
+    [(kind, {"what": "something"}) for kind in ALL],
+    ids=[f"{kind} fails on unknown arg" for kind in ALL],
 )
 def test_centrality_fails_on_unknown_args(
     graph: ig.Graph, kind_mapping: dict[str, ActiveType], how: CentralityKind, inputs: dict[str, Any]
@@ -61,9 +80,22 @@ def test_centrality_fails_on_unknown_args(
         _ = tg.activate(active).centrality(how=how, **inputs)
 
 
+@pytest.mark.parametrize(
+    "how",
+    ALL,
+    ids=[f"{kind} reports unknown arg" for kind in ALL],
+)
+def test_centrality_reports_unknown_args(graph: ig.Graph, kind_mapping: dict[str, ActiveType], how: CentralityKind):
+    tg = Tidygraph(graph=graph)
+    active = kind_mapping[how]
+    with pytest.raises(TidygraphValueError, match=r"unexpected.*\{'what'\}$"):
+        _ = tg.activate(active).centrality(how=how, what="something", weights="weight")
+
+
 @pytest.mark.parametrize(
     "how,weights",
-    [pytest.param(kind, "weight", id=f"{kind} accepts weights param") for kind in ALL],
+    [(kind, "weight") for kind in ALL],
+    ids=[f"{kind} accepts weights param" for kind in ALL],
 )
 def test_centrality_accepts_custom_weights(
     graph: ig.Graph,
@@ -78,9 +110,119 @@ def test_centrality_accepts_custom_weights(
     assert actual_len == 4
 
 
+def test_centrality_degree_treats_none_weights_as_unweighted(graph: ig.Graph):
+    tg = Tidygraph(graph=graph)
+    assert tg.centrality(how="degree", weights=None) == graph.degree()
+
+
+@pytest.mark.parametrize(
+    "how",
+    ALL,
+    ids=[f"{kind} accepts weights callable" for kind in ALL],
+)
+def test_centrality_accepts_weights_callable(
+    graph: ig.Graph,
+    kind_mapping: dict[str, ActiveType],
+    how: CentralityKind,
+):
+    tg = Tidygraph(graph=graph)
+    active = kind_mapping[how]
+    expected = tg.activate(active).centrality(how=how, weights="weight")
+    actual = tg.activate(active).centrality(how=how, weights=lambda df: df["weight"] * 1)
+    assert actual == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "how",
+    ALL,
+    ids=[f"{kind} accepts mapping weights callable" for kind in ALL],
+)
+def test_centrality_accepts_mapping_weights_callable(
+    graph: ig.Graph,
+    kind_mapping: dict[str, ActiveType],
+    how: CentralityKind,
+    mocker: MockerFixture,
+):
+    def weights(edges: Mapping[str, np.ndarray]) -> np.ndarray:
+        return edges["weight"] * 2
+
+    tg = Tidygraph(graph=graph)
+    active = kind_mapping[how]
+    expected = tg.activate(active).centrality(how=how, weights=lambda df: df["weight"] * 2)
+    spy = mocker.spy(ig.Graph, "get_edge_dataframe")
+    actual = tg.activate(active).centrality(how=how, weights=weights)
+    assert actual == pytest.approx(expected)
+    assert spy.call_count == 0
+
+
+@pytest.mark.parametrize(
+    "how",
+    ALL,
+    ids=[f"{kind} accepts string-annotated mapping weights callable" for kind in ALL],
+)
+def test_centrality_accepts_string_annotated_mapping_weights_callable(
+    graph: ig.Graph,
+    kind_mapping: dict[str, ActiveType],
+    how: CentralityKind,
+    mocker: MockerFixture,
+):
+    # the annotation a callable gets under `from __future__ import annotations`
+    def weights(edges: "Mapping[str, np.ndarray]") -> "np.ndarray":
+        return edges["weight"] * 2
+
+    tg = Tidygraph(graph=graph)
+    active = kind_mapping[how]
+    expected = tg.activate(active).centrality(how=how, weights=lambda df: df["weight"] * 2)
+    spy = mocker.spy(ig.Graph, "get_edge_dataframe")
+    actual = tg.activate(active).centrality(how=how, weights=weights)
+    assert actual == pytest.approx(expected)
+    assert spy.call_count == 0
+
+
+@pytest.mark.parametrize(
+    "annotation",
+    [
+        pytest.param("pd.DataFrme", id="unknown attribute"),
+        pytest.param("not valid(", id="invalid syntax"),
+        pytest.param("Undefined", id="unknown name"),
+    ],
+)
+def test_centrality_accepts_weights_callable_with_unresolvable_annotation(graph: ig.Graph, annotation: str):
+    def weights(df):
+        return df["weight"] * 2
+
+    weights.__annotations__ = {"df": annotation}
+
+    tg = Tidygraph(graph=graph)
+    expected = tg.centrality(how="betweenness", weights=lambda df: df["weight"] * 2)
+    assert tg.centrality(how="betweenness", weights=weights) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "how",
+    ALL,
+    ids=[f"{kind} skips edge dataframe" for kind in ALL],
+)
+def test_centrality_skips_edge_dataframe_without_callable(
+    graph: ig.Graph,
+    kind_mapping: dict[str, ActiveType],
+    how: CentralityKind,
+    mocker: MockerFixture,
+):
+    tg = Tidygraph(graph=graph)
+    active = kind_mapping[how]
+    expected = tg.activate(active).centrality(how=how, weights="weight")
+    spy = mocker.spy(ig.Graph, "get_edge_dataframe")
+    for weights in ("weight", np.asarray(graph.es["weight"]), pd.Series(graph.es["weight"])):
+        actual = tg.activate(active).centrality(how=how, weights=weights)
+        assert actual == pytest.approx(expected)
+    assert spy.call_count == 0
+
+
 @pytest.mark.parametrize(
     "how",
-    [pytest.param(kind, id=f"{kind} requires {KIND_MAPPING[kind]}") for kind in ALL],
+    ALL,
+    ids=[f"{kind} requires {KIND_MAPPING[kind]}" for kind in ALL],
 )
 def test_centrality_requires_correct_activation(
     graph: ig.Graph, kind_mapping: dict[str, ActiveType], how: CentralityKind
@@ -104,10 +246,148 @@ def test_centrality_requires_correct_activation(
     ],
 )
 def test_centrality_returns_expected_len(
-    graph: ig.Graph, kind_mapping: dict[str, ActiveType], how: str, expected: float
+    tg_by_active: dict[ActiveType, Tidygraph], kind_mapping: dict[str, ActiveType], how: str, expected: float
 ):
-    tg = Tidygraph(graph=graph)
-    active = kind_mapping[how]
-    actual = tg.activate(active).centrality(how=how)
+    actual = tg_by_active[kind_mapping[how]].centrality(how=how)
     actual_len = len(actual) if isinstance(actual, list) else 1
     assert actual_len == expected, f"Expected {how} results to have {expected} items but got {actual}"
+
+
+@pytest.mark.parametrize(
+    "func,single,active",
+    [
+        pytest.param(
+            centrality_betweenness_batch, centrality_betweenness, ActiveType.NODES, id="betweenness matches serial"
+        ),
+        pytest.param(
+            centrality_edge_betweenness_batch,
+            centrality_edge_betweenness,
+            ActiveType.EDGES,
+            id="edge_betweenness matches serial",
+        ),
+    ],
+)
+def test_centrality_batch_matches_serial(graph: ig.Graph, func, single, active: ActiveType):
+    graphs = [graph, graph.copy().as_directed(), ig.Graph.Ring(5)]
+    graphs[2].es["weight"] = [1.0, 2.0, 3.0, 4.0, 5.0]
+
+    actual = func(active, graphs, max_workers=2, weights=lambda df: df["weight"])
+    expected = [single(active, g, weights="weight") for g in graphs]
+    assert actual == expected
+
+
+def test_centrality_batch_validates_before_dispatch(graph: ig.Graph, mocker: MockerFixture):
+    executor = mocker.patch("tidygraph._utils.centrality.ProcessPoolExecutor")
+    with pytest.raises(TidygraphValueError):
+        _ = centrality_betweenness_batch(ActiveType.NODES, [graph], what="something")
+    with pytest.raises(TidygraphValueError):
+        _ = centrality_edge_betweenness_batch(ActiveType.NODES, [graph])
+    executor.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "how,directed",
+    [
+        pytest.param(kind, directed, id=f"{kind} {'directed' if directed else 'undirected'} chunked")
+        for kind in ["betweenness", "edge_betweenness"]
+        for directed in [True, False]
+    ],
+)
+def test_centrality_chunked_betweenness_is_exact(
+    kind_mapping: dict[str, ActiveType], how: CentralityKind, directed: bool
+):
+    random.seed(30)  # igraph draws from the `random` module; a fixed graph keeps failures reproducible
+    g = ig.Graph.Erdos_Renyi(n=30, m=80, directed=directed)
+    g.vs["name"] = [str(i) for i in range(g.vcount())]
+    g.es["weight"] = [1.0 + (i % 3) for i in range(g.ecount())]
+    tg = Tidygraph(graph=g).activate(kind_mapping[how])
+
+    expected = tg.centrality(how=how, weights="weight")
+    actual = tg.centrality(how=how, weights="weight", chunk_size=7)
+    assert actual == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "inputs",
+    [
+        pytest.param({"chunk_size": 0}, id="non-positive chunk size"),
+        pytest.param({"chunk_size": 2, "cutoff": 2}, id="chunk size with cutoff"),
+    ],
+)
+def test_centrality_chunked_betweenness_raises(graph: ig.Graph, inputs: dict[str, Any]):
+    tg = Tidygraph(graph=graph)
+    with pytest.raises(TidygraphValueError):
+        _ = tg.centrality(how="betweenness", **inputs)
+
+
+@pytest.mark.parametrize(
+    "directed,weights",
+    [
+        pytest.param(directed, weights, id=f"{'directed' if directed else 'undirected'} warm start with {weights}")
+        for directed in [True, False]
+        for weights in [None, "weight"]
+    ],
+)
+def test_centrality_pagerank_warm_start_matches(directed: bool, weights: str | None):
+    random.seed(30)  # igraph draws from the `random` module; a fixed graph keeps failures reproducible
+    g = ig.Graph.Erdos_Renyi(n=30, m=80, directed=directed)
+    g.add_vertices(1)  # dangling vertex
+    g.vs["name"] = [str(i) for i in range(g.vcount())]
+    g.es["weight"] = [1.0 + (i % 3) for i in range(g.ecount())]
+    tg = Tidygraph(graph=g)
+
+    expected = tg.centrality(how="pagerank", weights=weights)
+    cold = tg.centrality(how="pagerank", weights=weights, start=[1.0] * g.vcount())
+    warm = tg.centrality(how="pagerank", weights=weights, start=expected)
+    assert cold == pytest.approx(expected)
+    assert warm == pytest.approx(expected)
+
+
+def test_centrality_pagerank_warm_start_warns_without_convergence(graph: ig.Graph, mocker: MockerFixture):
+    mocker.patch("tidygraph._utils.centrality._PAGERANK_MAX_ITERATIONS", 1)
+    tg = Tidygraph(graph=graph)
+
+    with pytest.warns(RuntimeWarning, match="did not converge") as record:
+        _ = tg.centrality(how="pagerank", start=[1.0, 0.0, 0.0, 0.0])
+    assert record[0].filename == __file__
+
+
+def test_centrality_pagerank_warm_start_zero_weight_out_edges():
+    # "b" only leaves through a zero-weight edge, so it is dangling despite having an out-edge
+    g = ig.Graph(n=3, edges=[(0, 1), (1, 2)], directed=True, vertex_attrs={"name": ["a", "b", "c"]})
+    g.es["weight"] = [1.0, 0.0]
+    tg = Tidygraph(graph=g)
+
+    actual = tg.centrality(how="pagerank", weights="weight", start=[1.0, 1.0, 1.0])
+    assert actual == pytest.approx(g.pagerank(weights="weight"))
+
+
+@pytest.mark.parametrize(
+    "inputs",
+    [
+        pytest.param({"start": [1.0, 1.0]}, id="start of wrong length"),
+        pytest.param({"start": [1.0, -1.0, 1.0, 1.0]}, id="negative start"),
+        pytest.param({"start": [1.0] * 4, "implementation": "arpack"}, id="start with implementation"),
+        pytest.param({"start": [1.0] * 4, "reset_vertices": [0]}, id="start with reset vertices"),
+    ],
+)
+def test_centrality_pagerank_warm_start_raises(graph: ig.Graph, inputs: dict[str, Any]):
+    tg = Tidygraph(graph=graph)
+    with pytest.raises(TidygraphValueError):
+        _ = tg.centrality(how="pagerank", **inputs)
+
+
+@pytest.mark.parametrize(
+    "reset",
+    [
+        pytest.param([0.1, 0.2, 0.3, 0.4], id="list reset"),
+        pytest.param(pd.Series([0.1, 0.2, 0.3, 0.4]), id="series reset"),
+    ],
+)
+def test_centrality_pagerank_personalized(graph: ig.Graph, reset: list[float] | pd.Series):
+    tg = Tidygraph(graph=graph)
+    expected = graph.personalized_pagerank(reset=[0.1, 0.2, 0.3, 0.4])
+    assert tg.centrality(how="pagerank", reset=reset) == pytest.approx(expected)
+    assert tg.centrality(how="pagerank", reset_vertices=[0]) == pytest.approx(
+        graph.personalized_pagerank(reset_vertices=[0])
+    )
@@ -1,62 +1,36 @@
-import pandas as pd
+import numpy as np
 import polars as pl
 import pytest
 
 from tidygraph import Tidygraph
 from tidygraph.exceptions import TidygraphValueError
 
+NODES_DF = pl.DataFrame({"name": ["a", "b", "c"]})
+EDGES_DF = pl.DataFrame(
+    {
+        "from": ["a", "b", "c"],
+        "to": ["b", "c", "a"],
+        "weight": [1.0, 2.0, 3.0],
+    }
+)
+# missing the "name" column
+BAD_NODES_DF = pl.DataFrame({"not_a_name": ["a", "b", "c"]})
+# endpoints in "source"/"target" instead of "from"/"to"
+BAD_EDGES_DF = pl.DataFrame(
+    {
+        "source": ["a", "b", "c"],
+        "target": ["b", "c", "a"],
+        "weight": [1.0, 2.0, 3.0],
+    }
+)
+
 
 @pytest.mark.parametrize(
     "nodes_df,edges_df,use_vids",
     [
-        pytest.param(
-            pl.DataFrame(
-                {
-                    "not_a_name": ["a", "b", "c"],
-                }
-            ),
-            pl.DataFrame(
-                {
-                    "from": ["a", "b", "c"],
-                    "to": ["b", "c", "a"],
-                    "weight": [1.0, 2.0, 3.0],
-                }
-            ),
-            False,
-            id="invalid nodes dataframe",
-        ),
-        pytest.param(
-            pl.DataFrame(
-                {
-                    "name": ["a", "b", "c"],
-                }
-            ),
-            pl.DataFrame(
-                {
-                    "source": ["a", "b", "c"],
-                    "target": ["b", "c", "a"],
-                    "weight": [1.0, 2.0, 3.0],
-                }
-            ),
-            False,
-            id="invalid edges dataframe",
-        ),
-        pytest.param(
-            pl.DataFrame(
-                {
-                    "name": ["a", "b", "c"],
-                }
-            ),
-            pl.DataFrame(
-                {
-                    "from": ["a", "b", "c"],
-                    "to": ["b", "c", "a"],
-                    "weight": [1.0, 2.0, 3.0],
-                }
-            ),
-            True,
-            id="invalid vids dataframes",
-        ),
+        pytest.param(BAD_NODES_DF, EDGES_DF, False, id="invalid nodes dataframe"),
+        pytest.param(NODES_DF, BAD_EDGES_DF, False, id="invalid edges dataframe"),
+        pytest.param(NODES_DF, EDGES_DF, True, id="invalid vids dataframes"),
     ],
 )
 def test_invalid_from_dataframe(nodes_df: pl.DataFrame, edges_df: pl.DataFrame, use_vids: bool):
@@ -65,54 +39,31 @@ def test_invalid_from_dataframe(nodes_df: pl.DataFrame, edges_df: pl.DataFrame,
 
 
 def test_from_dataframe_with_nodes():
-    edges_df = pl.DataFrame(
-        {
-            "from": ["a", "b", "c"],
-            "to": ["b", "c", "a"],
-            "weight": [1.0, 2.0, 3.0],
-        }
-    )
-    nodes_df = pl.DataFrame(
-        {
-            "name": ["a", "b", "c"],
-        }
-    )
-    g = Tidygraph.from_dataframe(edges=edges_df, nodes=nodes_df)
+    g = Tidygraph.from_dataframe(edges=EDGES_DF, nodes=NODES_DF)
 
     vertex_df = g.vertex_dataframe
     edge_df = g.edge_dataframe
 
-    expected_nodes = pd.Series(["a", "b", "c"])
-    assert expected_nodes.equals(vertex_df["name"])
+    assert np.array_equal(vertex_df["name"].to_numpy(), ["a", "b", "c"])
 
     description = g.describe()
     assert description == "undirected simple graph with 1 component(s)"
 
-    expected_weights = pd.Series([1.0, 2.0, 3.0])
-    assert expected_weights.equals(edge_df["weight"])
+    assert np.array_equal(edge_df["weight"].to_numpy(), [1.0, 2.0, 3.0])
 
 
 def test_from_dataframe_from_edges():
-    edges_df = pl.DataFrame(
-        {
-            "from": ["a", "b", "c"],
-            "to": ["b", "c", "a"],
-            "weight": [1.0, 2.0, 3.0],
-        }
-    )
-    g = Tidygraph.from_dataframe(edges=edges_df)
+    g = Tidygraph.from_dataframe(edges=EDGES_DF)
 
     vertex_df = g.vertex_dataframe
     edge_df = g.edge_dataframe
 
-    expected_nodes = pd.Series(["a", "b", "c"])
-    assert expected_nodes.equals(vertex_df["name"])
+    assert np.array_equal(vertex_df["name"].to_numpy(), ["a", "b", "c"])
 
     description = g.describe()
     assert description == "undirected simple graph with 1 component(s)"
 
-    expected_weights = pd.Series([1.0, 2.0, 3.0])
-    assert expected_weights.equals(edge_df["weight"])
+    assert np.array_equal(edge_df["weight"].to_numpy(), [1.0, 2.0, 3.0])
 
 
 def test_from_dataframe_with_vids():
@@ -128,5 +79,4 @@ def test_from_dataframe_with_vids():
     vertex_df = g.vertex_dataframe
     edges_df = g.edge_dataframe
 
-    expected_nodes = pd.Series(["a", "b", "c", "b"])
-    assert expected_nodes.equals(vertex_df["name"])
+    assert np.array_equal(vertex_df["name"].to_numpy(), ["a", "b", "c", "b"])
@@ -713,3 +713,156 @@ def test_conflicted_joins(
     left, right = f"{attr_name}.x", f"{attr_name}.y"
     assert expected_x_attr.equals(edges[left])
     assert expected_y_attr.equals(edges[right])
+
+
+@pytest.mark.parametrize("how", ["outer", "inner", "left", "right"])
+def test_join_keeps_missing_attributes(graph: ig.Graph, how: Literal["outer", "inner", "left", "right"]) -> None:
+    """Tests that attributes without any values are not dropped by a join."""
+    graph.vs["empty"] = [None] * N
+    y = pd.DataFrame({"name": ["a", "b"], "new_attr": [1, 2]})
+    tg = Tidygraph(graph=graph).activate(ActiveType.NODES).join(y, how=how)
+
+    node_df = tg.vertex_dataframe
+
+    assert "empty" in node_df.columns
+    assert node_df["empty"].isna().all()
+
+
+@pytest.mark.parametrize("how", ["outer", "inner", "left", "right"])
+def test_join_edges_on_edgeless_graph(how: Literal["outer", "inner", "left", "right"]) -> None:
+    """Tests that edges can be joined onto a graph without any edges."""
+    graph = ig.Graph(n=N, vertex_attrs={"name": ["a", "b", "c", "d"]})
+    y = pd.DataFrame({"from": ["a", "b"], "to": ["c", "d"], "weight": [1.0, 2.0]})
+    tg = Tidygraph(graph=graph).activate(ActiveType.EDGES).join(y, how=how)
+
+    edges = tg.edge_dataframe
+
+    expected = 2 if how in ("outer", "right") else 0
+    assert len(edges) == expected
+
+
+def test_outer_join_undirected_edges_match_mirrored() -> None:
+    """Tests that undirected edges match regardless of orientation, and that new self-loops are added once."""
+    graph = ig.Graph(
+        n=N,
+        edges=[(0, 1), (0, 2), (1, 3), (2, 3)],
+        vertex_attrs={"name": ["a", "b", "c", "d"]},
+        edge_attrs={"weight": [1.0, 2.0, 3.0, 4.0]},
+    )
+    y = pd.DataFrame({"from": ["b", "d"], "to": ["a", "d"], "weight": [5.0, 6.0]})
+    tg = Tidygraph(graph=graph).activate(ActiveType.EDGES).join(y, how="outer")
+
+    edges = tg.edge_dataframe
+
+    assert list(zip(edges["source"], edges["target"], strict=True)) == [(0, 1), (0, 2), (1, 3), (2, 3), (3, 3)]
+    assert pd.Series([1.0, 2.0, 3.0, 4.0, np.nan]).equals(edges["weight.x"])
+    assert pd.Series([5.0, np.nan, np.nan, np.nan, 6.0]).equals(edges["weight.y"])
+
+
+@pytest.mark.parametrize("how", ["outer", "inner", "left", "right"])
+def test_join_does_not_modify_input(
+    graph: ig.Graph, active_type: ActiveType, how: Literal["outer", "inner", "left", "right"]
+) -> None:
+    """Tests that joining leaves the given dataframe untouched."""
+    if active_type == ActiveType.NODES:
+        y = pd.DataFrame({"name": ["a", "e"], "new_attr": [1.0, 2.0]})
+    else:
+        y = pd.DataFrame({"from": ["a", "b"], "to": ["b", "d"], "new_attr": [1.0, 2.0]})
+    original = y.copy()
+    _ = Tidygraph(graph=graph).activate(active_type).join(y, how=how)
+
+    assert y.equals(original)
+
+
+def test_right_join_undirected_edges_match_self_loops_once() -> None:
+    """Tests that a right join keeps one edge per matching row for mirrored edges and self-loops."""
+    graph = ig.Graph(
+        n=N,
+        edges=[(0, 1), (2, 2), (1, 3)],
+        vertex_attrs={"name": ["a", "b", "c", "d"]},
+        edge_attrs={"weight": [1.0, 2.0, 3.0]},
+    )
+    y = pd.DataFrame({"from": ["b", "c", "c"], "to": ["a", "c", "c"], "new_attr": [5.0, 6.0, 7.0]})
+    tg = Tidygraph(graph=graph).activate(ActiveType.EDGES).join(y, how="right")
+
+    edges = tg.edge_dataframe
+
+    assert list(zip(edges["source"], edges["target"], strict=True)) == [(0, 1), (2, 2), (2, 2)]
+    assert pd.Series([1.0, 2.0, 2.0]).equals(edges["weight"])
+    assert pd.Series([5.0, 6.0, 7.0]).equals(edges["new_attr"])
+
+
+def test_right_join_nodes_with_duplicated_keys(graph: ig.Graph) -> None:
+    """Tests that a right join duplicates a vertex whose ID is beyond the rows of y once per matching row."""
+    y = pd.DataFrame({"name": ["d", "d"], "new_attr": [1.0, 2.0]})
+    tg = Tidygraph(graph=graph).activate(ActiveType.NODES).join(y, how="right")
+
+    nodes = tg.vertex_dataframe
+
+    assert list(nodes["name"]) == ["d", "d"]
+    assert pd.Series([1.0, 2.0]).equals(nodes["new_attr"])
+
+
+def test_right_join_edges_with_duplicated_keys(graph: ig.Graph) -> None:
+    """Tests that a right join duplicates an edge whose ID is beyond the rows of y once per matching row."""
+    graph.es["weight"] = [1.0, 2.0, 3.0, 4.0]
+    y = pd.DataFrame({"from": ["c", "c"], "to": ["d", "d"], "new_attr": [1.0, 2.0]})
+    tg = Tidygraph(graph=graph).activate(ActiveType.EDGES).join(y, how="right")
+
+    edges = tg.edge_dataframe
+
+    assert list(zip(edges["source"], edges["target"], strict=True)) == [(2, 3), (2, 3)]
+    assert pd.Series([4.0, 4.0]).equals(edges["weight"])
+    assert pd.Series([1.0, 2.0]).equals(edges["new_attr"])
+
+
+def test_right_join_edges_keeps_attributes_with_multi_edges() -> None:
+    """Tests that a right join keeps every edge's attributes when a row of y matches several parallel edges."""
+    graph = ig.Graph(
+        n=3,
+        directed=True,
+        edges=[(0, 1), (1, 2), (0, 1)],
+        vertex_attrs={"name": ["a", "b", "c"]},
+        edge_attrs={"weight": [1.0, 2.0, 3.0]},
+    )
+    y = pd.DataFrame({"from": ["b", "a"], "to": ["c", "b"], "new_attr": [5.0, 6.0]})
+    tg = Tidygraph(graph=graph).activate(ActiveType.EDGES).join(y, how="right")
+
+    edges = tg.edge_dataframe
+
+    assert list(zip(edges["source"], edges["target"], strict=True)) == [(0, 1), (1, 2), (0, 1)]
+    assert pd.Series([1.0, 2.0, 3.0]).equals(edges["weight"])
+    assert pd.Series([6.0, 5.0, 6.0]).equals(edges["new_attr"])
+
+
+def test_left_join_keeps_carried_attribute_values(graph: ig.Graph) -> None:
+    """Tests that attributes not involved in a join keep their exact values when no rows change."""
+    graph.vs["mixed"] = [1, None, 3, 4]
+    y = pd.DataFrame({"name": ["a", "b"], "new_attr": [1.0, 2.0]})
+    _ = Tidygraph(graph=graph).activate(ActiveType.NODES).join(y, how="left")
+
+    assert graph.vs["mixed"] == [1, None, 3, 4]
+    assert graph.vs["new_attr"][:2] == [1.0, 2.0]
+
+
+@pytest.mark.parametrize("how", ["inner", "left"])
+def test_join_undirected_self_loop_matches_once(how: Literal["inner", "left"]) -> None:
+    """Tests that a self-loop in an undirected graph is matched once by a single row, in either orientation."""
+    graph = ig.Graph(n=N, edges=[(0, 1), (2, 2)], vertex_attrs={"name": ["a", "b", "c", "d"]})
+    y = pd.DataFrame({"from": ["b", "c"], "to": ["a", "c"], "new_attr": [1.0, 2.0]})
+    tg = Tidygraph(graph=graph).activate(ActiveType.EDGES).join(y, how=how)
+
+    edges = tg.edge_dataframe
+
+    assert list(zip(edges["source"], edges["target"], strict=True)) == [(0, 1), (2, 2)]
+    assert pd.Series([1.0, 2.0]).equals(edges["new_attr"])
+
+
+def test_outer_join_edges_to_unknown_nodes_raises(graph: ig.Graph) -> None:
+    """Tests that new edges to nodes missing from the graph are rejected before the graph is modified."""
+    y = pd.DataFrame({"from": ["a", "z"], "to": ["d", "b"], "new_attr": [1.0, 2.0]})
+    edges = graph.get_edgelist()
+    with pytest.raises(TidygraphValueError):
+        _ = Tidygraph(graph=graph).activate(ActiveType.EDGES).join(y, how="outer")
+
+    assert graph.get_edgelist() == edges
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Callable
 
+import igraph as ig
 import pandas as pd
 import polars as pl
 import pytest
@@ -273,3 +274,12 @@ def test_chained_mutations():
 
     assert expected_edges_df.to_pandas().set_index("edge ID").equals(edges_result)
     assert expected_nodes_df.to_pandas().set_index("vertex ID").equals(nodes_result)
+
+
+def test_mutate_keeps_other_attribute_values():
+    """Tests that mutate only writes the assigned attributes back to the graph."""
+    graph = ig.Graph(n=3, edges=[(0, 1), (1, 2)], vertex_attrs={"name": ["a", "b", "c"], "mixed": [1, None, 3]})
+    tg = Tidygraph(graph=graph).activate(ActiveType.NODES).mutate(double=lambda x: x["mixed"] * 2)
+
+    assert graph.vs["mixed"] == [1, None, 3]
+    assert tg.vertex_dataframe["double"].tolist()[::2] == [2.0, 6.0]